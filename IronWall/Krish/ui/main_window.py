@@ -1009,7 +1009,7 @@ class IronWallMainWindow:
                 stats = vt_result['data']['attributes'].get('last_analysis_stats', {})
                 malicious = stats.get('malicious', 0)
                 undetected = stats.get('undetected', 0)
-                self.scan_panel.current_file_var.set(f"VirusTotal: {malicious} flagged, {undetected} undetected.")
+                self.scan_panel.set_current_file(f"VirusTotal: {malicious} flagged, {undetected} undetected.")
             
             # Update progress after each file is processed
             progress_callback(full_path, None, {
@@ -1056,7 +1056,7 @@ class IronWallMainWindow:
             
             if total_files == 0:
                 if hasattr(self, 'scan_panel') and self.scan_panel:
-                    self.scan_panel.current_file_var.set('No files found to scan.')
+                    self.scan_panel.set_current_file('No files found to scan.')
                     self.scan_panel.stop_time_tracking()
                 import tkinter.messagebox as mb
                 mb.showinfo('Scan', 'No files found to scan in the selected locations. Some files may be inaccessible due to permissions.')
@@ -1081,13 +1081,13 @@ class IronWallMainWindow:
                         )
                 except PermissionError:
                     if hasattr(self, 'scan_panel') and self.scan_panel:
-                        self.scan_panel.current_file_var.set(f'Permission denied: {path}')
+                        self.scan_panel.set_current_file(f'Permission denied: {path}')
                     import tkinter.messagebox as mb
                     mb.showwarning('Permission Denied', f'Permission denied while scanning: {path}. This file or folder will be skipped.')
                     print(f"[DEBUG] Permission denied while scanning: {path}")
                 except Exception as e:
                     if hasattr(self, 'scan_panel') and self.scan_panel:
-                        self.scan_panel.current_file_var.set(f'Error: {e}')
+                        self.scan_panel.set_current_file(f'Error: {e}')
                     import tkinter.messagebox as mb
                     mb.showerror('Scan Error', f'Error while scanning {path}: {e}')
                     print(f"[DEBUG] Error while scanning {path}: {e}")
@@ -1097,14 +1097,14 @@ class IronWallMainWindow:
             
             if hasattr(self, 'scan_panel') and self.scan_panel:
                 self.scan_panel.set_scan_complete(self.files_scanned, self.threats_found, scan_duration)
-                self.scan_panel.current_file_var.set('Scan complete.')
+                self.scan_panel.set_current_file('Scan complete.')
                 self.scan_panel.stop_time_tracking()
             
             self.scanning = False
             
             if self.files_scanned == 0:
                 if hasattr(self, 'scan_panel') and self.scan_panel:
-                    self.scan_panel.current_file_var.set('No files scanned.')
+                    self.scan_panel.set_current_file('No files scanned.')
                     self.scan_panel.stop_time_tracking()
                 import tkinter.messagebox as mb
                 mb.showinfo('Scan', 'No files were scanned. Some files may be inaccessible due to permissions or folder selection.')
@@ -1116,13 +1116,13 @@ class IronWallMainWindow:
         self.paused = True
         if hasattr(self, 'scanner'):
             self.scanner.paused = True
-        self.scan_panel.current_file_var.set('Scan paused.')
+        self.scan_panel.set_current_file('Scan paused.')
 
     def resume_scan(self):
         self.paused = False
         if hasattr(self, 'scanner'):
             self.scanner.paused = False
-        self.scan_panel.current_file_var.set('Scan resumed.')
+        self.scan_panel.set_current_file('Scan resumed.')
 
     def stop_scan(self):
         self.stop_scanning = True
@@ -1682,10 +1682,9 @@ class IronWallMainWindow:
 
     def progress_callback(self, current_file, progress, stats):
         self.scan_panel.progress_var.set(progress)
-        self.scan_panel.current_file_var.set(current_file)
-        if hasattr(self.scan_panel, 'progress_pct_var'):
-            pct = int(progress)
-            self.scan_panel.progress_pct_var.set(f'Scan Progress: {pct}%')
+        self.scan_panel.set_current_file(current_file)
+        pct = int(progress)
+        self.scan_panel.set_progress_text(f'Scan Progress: {pct}%')
 
     def update_scan_summary(self):
         self.total_files_label.config(text=f"Total Files: {self.total_files}")
@@ -1775,13 +1774,13 @@ class IronWallMainWindow:
         self.paused = True
         if hasattr(self, 'scanner'):
             self.scanner.paused = True
-        self.scan_panel.current_file_var.set('Scan paused.')
+        self.scan_panel.set_current_file('Scan paused.')
 
     def resume_scan(self):
         self.paused = False
         if hasattr(self, 'scanner'):
             self.scanner.paused = False
-        self.scan_panel.current_file_var.set('Scan resumed.')
+        self.scan_panel.set_current_file('Scan resumed.')
 
     def add_scan_result(self, file_name, full_path, file_size, file_type, threat_type, md5_hash, sha256_hash, status, heuristic):
         # Do not add the progress row as a file row
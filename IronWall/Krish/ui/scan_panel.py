@@ -26,16 +26,13 @@ class ScanPanel(ttk.Frame):
         
         # Time tracking variables
         self.scan_start_time = None
-        self.scan_elapsed_time = tk.StringVar(value='00:00:00')
-        self.scan_eta = tk.StringVar(value='--:--:--')
-        self.scan_speed = tk.StringVar(value='0 files/sec')
-        self.scan_status = tk.StringVar(value='Ready to scan')
-        self.scan_phase = tk.StringVar(value='Idle')
+        self._label_text = {}  # Last text pushed to each display-only label (see _set_label_text)
         self.total_files_estimate = 0
         self.files_scanned = 0
         self.scan_speed_history = []
         self.update_timer = None
         self._progress_mode = None  # Track current progress bar mode
+        self._resource_tick = 0  # Counts CPU samples; RAM is sampled every 4th tick
         
         self._build_ui()
 
@@ -126,11 +123,14 @@ class ScanPanel(ttk.Frame):
                     time_row1 = ttk.Frame(time_frame)
                     time_row1.pack(fill='x', pady=2)
                     ttk.Label(time_row1, text='⏱ Elapsed:', font=('Segoe UI', 10, 'bold')).pack(side='left')
-                    ttk.Label(time_row1, textvariable=self.scan_elapsed_time, font=('Segoe UI', 11, 'bold'), foreground='#1976D2').pack(side='left', padx=4)
+                    self.elapsed_label = ttk.Label(time_row1, text='00:00:00', font=('Segoe UI', 11, 'bold'), foreground='#1976D2')
+                    self.elapsed_label.pack(side='left', padx=4)
                     ttk.Label(time_row1, text='| ⏳ ETA:', font=('Segoe UI', 10, 'bold')).pack(side='left', padx=(16, 0))
-                    ttk.Label(time_row1, textvariable=self.scan_eta, font=('Segoe UI', 11, 'bold'), foreground='#FF9800').pack(side='left', padx=4)
+                    self.eta_label = ttk.Label(time_row1, text='--:--:--', font=('Segoe UI', 11, 'bold'), foreground='#FF9800')
+                    self.eta_label.pack(side='left', padx=4)
                     ttk.Label(time_row1, text='| 🚀 Speed:', font=('Segoe UI', 10, 'bold')).pack(side='left', padx=(16, 0))
-                    ttk.Label(time_row1, textvariable=self.scan_speed, font=('Segoe UI', 11, 'bold'), foreground='#4CAF50').pack(side='left', padx=4)
+                    self.speed_label = ttk.Label(time_row1, text='0 files/sec', font=('Segoe UI', 11, 'bold'), foreground='#4CAF50')
+                    self.speed_label.pack(side='left', padx=4)
                     
                     # Row 2: Scan Statistics
                     stat_row = ttk.Frame(time_frame)
@@ -150,21 +150,22 @@ class ScanPanel(ttk.Frame):
                     status_row = ttk.Frame(time_frame)
                     status_row.pack(fill='x', pady=2)
                     ttk.Label(status_row, text='📊 Status:', font=('Segoe UI', 10, 'bold')).pack(side='left')
-                    ttk.Label(status_row, textvariable=self.scan_status, font=('Segoe UI', 10, 'italic'), foreground='#666666').pack(side='left', padx=4)
+                    self.status_label = ttk.Label(status_row, text='Ready to scan', font=('Segoe UI', 10, 'italic'), foreground='#666666')
+                    self.status_label.pack(side='left', padx=4)
                     ttk.Label(status_row, text='| 🔄 Phase:', font=('Segoe UI', 10, 'bold')).pack(side='left', padx=(16, 0))
-                    ttk.Label(status_row, textvariable=self.scan_phase, font=('Segoe UI', 10, 'italic'), foreground='#1976D2').pack(side='left', padx=4)
+                    self.phase_label = ttk.Label(status_row, text='Idle', font=('Segoe UI', 10, 'italic'), foreground='#1976D2')
+                    self.phase_label.pack(side='left', padx=4)
                     
                     # Current file being scanned
-                    self.current_file_var = tk.StringVar(value='Ready to scan')
                     current_file_frame = ttk.Frame(status_frame)
                     current_file_frame.pack(fill='x', pady=4)
                     ttk.Label(current_file_frame, text='📄 Current:', font=('Segoe UI', 10, 'bold')).pack(side='left')
-                    ttk.Label(current_file_frame, textvariable=self.current_file_var, font=('Segoe UI', 10, 'italic'), foreground='#333333').pack(side='left', padx=4)
+                    self.current_file_label = ttk.Label(current_file_frame, text='Ready to scan', font=('Segoe UI', 10, 'italic'), foreground='#333333')
+                    self.current_file_label.pack(side='left', padx=4)
                     
                     # Progress bar with percentage
                     self.progress_var = tk.DoubleVar(value=0)
-                    self.progress_pct_var = tk.StringVar(value='Scan Progress: 0%')
-                    self.progress_pct_label = ttk.Label(status_frame, textvariable=self.progress_pct_var, font=('Segoe UI', 10, 'bold'))
+                    self.progress_pct_label = ttk.Label(status_frame, text='Scan Progress: 0%', font=('Segoe UI', 10, 'bold'))
                     self.progress_pct_label.pack(anchor='w', pady=(4, 0))
                     self.progressbar = ttk.Progressbar(status_frame, variable=self.progress_var, maximum=100, length=420, style='TProgressbar', mode='determinate')
                     self.progressbar.pack(fill='x', pady=8)
@@ -192,10 +193,12 @@ class ScanPanel(ttk.Frame):
                         'Status': 100,
                         'Time': 80
                     }
+                    # Fixed widths; only 'Path' stretches so Tk doesn't rebalance every column on insert/resize
                     for col in columns:
                         anchor = 'w' if col in ['File', 'Path', 'Threat'] else 'center'
                         self.results_tree.heading(col, text=col, anchor=anchor)
-                        self.results_tree.column(col, width=col_widths[col], anchor=anchor, stretch=True)
+                        self.results_tree.column(col, width=col_widths[col], anchor=anchor, stretch=(col == 'Path'))
+                    self.results_tree['displaycolumns'] = columns
                     
                     # Add vertical and horizontal scrollbars
                     vsb = ttk.Scrollbar(results_frame, orient='vertical', command=self.results_tree.yview)
@@ -375,7 +378,7 @@ class ScanPanel(ttk.Frame):
         if self.scan_start_time:
             elapsed = time.time() - self.scan_start_time
             elapsed_str = str(timedelta(seconds=int(elapsed)))
-            self.scan_elapsed_time.set(elapsed_str)
+            self._set_label_text(self.elapsed_label, elapsed_str)
             
             # Calculate ETA if we have files scanned
             if self.files_scanned > 0 and self.total_files_estimate > 0:
@@ -383,9 +386,9 @@ class ScanPanel(ttk.Frame):
                 remaining_files = self.total_files_estimate - self.files_scanned
                 eta_seconds = remaining_files / avg_speed if avg_speed > 0 else 0
                 eta_str = str(timedelta(seconds=int(eta_seconds))) if eta_seconds > 0 else '--:--:--'
-                self.scan_eta.set(eta_str)
+                self._set_label_text(self.eta_label, eta_str)
             else:
-                self.scan_eta.set('--:--:--')
+                self._set_label_text(self.eta_label, '--:--:--')
             
             # Update scan speed
             if elapsed > 0:
@@ -394,12 +397,30 @@ class ScanPanel(ttk.Frame):
                 if len(self.scan_speed_history) > 10:  # Keep last 10 samples
                     self.scan_speed_history.pop(0)
                 avg_speed = sum(self.scan_speed_history) / len(self.scan_speed_history)
-                self.scan_speed.set(f'{avg_speed:.1f} files/sec')
+                self._set_label_text(self.speed_label, f'{avg_speed:.1f} files/sec')
             else:
-                self.scan_speed.set('0 files/sec')
+                self._set_label_text(self.speed_label, '0 files/sec')
         
         # Schedule next update
         self.update_timer = self.after(1000, self._update_time_display)
+
+    def _set_label_text(self, label, text):
+        """Configure a display-only label, skipping the Tk call when the text is unchanged"""
+        if self._label_text.get(str(label)) != text:
+            label.config(text=text)
+            self._label_text[str(label)] = text
+
+    def set_current_file(self, text):
+        """Update the 'Current:' line of the progress panel"""
+        self._set_label_text(self.current_file_label, text)
+
+    def set_progress_text(self, text):
+        """Update the text shown above the progress bar"""
+        self._set_label_text(self.progress_pct_label, text)
+
+    def _set_phase(self, phase, status):
+        self._set_label_text(self.phase_label, phase)
+        self._set_label_text(self.status_label, status)
         
     def set_progress_mode(self, mode):
         """Switch progress bar between determinate and indeterminate mode."""
@@ -410,11 +431,11 @@ class ScanPanel(ttk.Frame):
         if mode == 'indeterminate':
             self.progressbar.config(mode='indeterminate')
             self.progressbar.start(20)
-            self.progress_pct_var.set('Scanning...')
+            self.set_progress_text('Scanning...')
             print('[DEBUG] Progress bar set to indeterminate mode')
         else:
             self.progressbar.config(mode='determinate')
-            self.progress_pct_var.set('Scan Progress: 0%')
+            self.set_progress_text('Scan Progress: 0%')
             print('[DEBUG] Progress bar set to determinate mode')
 
     def update_scan_progress(self, current_file, progress, stats):
@@ -431,45 +452,38 @@ class ScanPanel(ttk.Frame):
                 self.files_scanned = files_scanned
             if self._progress_mode == 'determinate' and progress is not None:
                 self.progress_var.set(progress)
-                self.progress_pct_var.set(f'Scan Progress: {progress:.1f}%')
+                self.set_progress_text(f'Scan Progress: {progress:.1f}%')
                 print(f'[DEBUG] Progress bar value set to {progress:.1f}%')
             elif self._progress_mode == 'indeterminate':
-                self.progress_pct_var.set('Scanning...')
+                self.set_progress_text('Scanning...')
                 print('[DEBUG] Progress bar in indeterminate mode (no value set)')
             if current_file:
                 filename = os.path.basename(current_file)
-                self.current_file_var.set(f'{filename} ({current_file})')
+                self.set_current_file(f'{filename} ({current_file})')
             if progress is not None and self._progress_mode == 'determinate':
                 if progress < 10:
-                    self.scan_phase.set('Initializing')
-                    self.scan_status.set('Preparing scan environment...')
+                    self._set_phase('Initializing', 'Preparing scan environment...')
                 elif progress < 30:
-                    self.scan_phase.set('System Scan')
-                    self.scan_status.set('Scanning system files and registry...')
+                    self._set_phase('System Scan', 'Scanning system files and registry...')
                 elif progress < 60:
-                    self.scan_phase.set('File Analysis')
-                    self.scan_status.set('Analyzing file contents and patterns...')
+                    self._set_phase('File Analysis', 'Analyzing file contents and patterns...')
                 elif progress < 90:
-                    self.scan_phase.set('Threat Detection')
-                    self.scan_status.set('Detecting and analyzing threats...')
+                    self._set_phase('Threat Detection', 'Detecting and analyzing threats...')
                 else:
-                    self.scan_phase.set('Finalizing')
-                    self.scan_status.set('Completing scan and generating report...')
+                    self._set_phase('Finalizing', 'Completing scan and generating report...')
             elif self._progress_mode == 'indeterminate':
-                self.scan_phase.set('Scanning')
-                self.scan_status.set('Scanning files...')
+                self._set_phase('Scanning', 'Scanning files...')
         self.after(0, do_update)
 
     def set_scan_complete(self, total_files, total_threats, scan_duration):
         """Set scan completion status"""
-        self.scan_phase.set('Complete')
-        self.scan_status.set(f'Scan completed in {str(timedelta(seconds=int(scan_duration)))}')
+        self._set_phase('Complete', f'Scan completed in {str(timedelta(seconds=int(scan_duration)))}')
         self.files_scanned_var.set(total_files)
         self.threats_found_var.set(total_threats)
         # Ensure progress bar is full
         self.set_progress_mode('determinate')
         self.progress_var.set(100)
-        self.progress_pct_var.set('Scan Progress: 100.0%')
+        self.set_progress_text('Scan Progress: 100.0%')
         self.stop_time_tracking()
 
     def destroy(self):
@@ -481,17 +495,16 @@ class ScanPanel(ttk.Frame):
 
     def _on_refresh_scan_panel(self):
         """Reset the scan panel UI to its initial state."""
-        self.scan_status.set('Ready to scan')
-        self.scan_phase.set('Idle')
-        self.scan_elapsed_time.set('00:00:00')
-        self.scan_eta.set('--:--:--')
-        self.scan_speed.set('0 files/sec')
+        self._set_phase('Idle', 'Ready to scan')
+        self._set_label_text(self.elapsed_label, '00:00:00')
+        self._set_label_text(self.eta_label, '--:--:--')
+        self._set_label_text(self.speed_label, '0 files/sec')
         self.files_scanned_var.set(0)
         self.threats_found_var.set(0)
         self.total_files_var.set(0)
         self.progress_var.set(0)
-        self.progress_pct_var.set('Scan Progress: 0%')
-        self.current_file_var.set('Ready to scan')
+        self.set_progress_text('Scan Progress: 0%')
+        self.set_current_file('Ready to scan')
         # Clear results table
         if hasattr(self, 'results_tree'):
             for item in self.results_tree.get_children():
@@ -512,9 +525,12 @@ class ScanPanel(ttk.Frame):
 
     def _update_resource_usage(self):
         cpu = psutil.cpu_percent(interval=None)
-        ram = psutil.virtual_memory().percent
         self.cpu_label.config(text=f'CPU: {cpu:.1f}%')
-        self.ram_label.config(text=f'RAM: {ram:.1f}%')
+        # RAM% barely moves second-to-second, so sample it at a quarter of the CPU rate
+        if self._resource_tick % 4 == 0:
+            ram = psutil.virtual_memory().percent
+            self.ram_label.config(text=f'RAM: {ram:.1f}%')
+        self._resource_tick += 1
         self.after(1000, self._update_resource_usage)
 
 # Tooltip helper (simple)
@@ -1,40 +1,152 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
+from contextlib import contextmanager
+import asyncio
 import threading
+import time
+
+# One asyncio loop on one daemon thread, shared by every scheduler panel
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+def _get_async_loop():
+    """Return the shared background event loop, starting its thread on first use"""
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(target=_async_loop.run_forever, name='scheduler-async', daemon=True).start()
+        return _async_loop
+
+class AutoScrollbar(ttk.Scrollbar):
+    """Scrollbar that drops out of its grid while the whole view fits"""
+
+    def set(self, lo, hi):
+        if float(lo) <= 0.0 and float(hi) >= 1.0:
+            self.grid_remove()
+        else:
+            self.grid()
+        super().set(lo, hi)
+
+@contextmanager
+def _suspended(tree):
+    """Hide a treeview's columns while it is mutated so Tk lays it out once at the end"""
+    tree.tk.call('update', 'idletasks')
+    tree.configure(displaycolumns=())
+    try:
+        yield tree
+    finally:
+        tree.configure(displaycolumns='#all')
+
+# Emoji-prefixed display strings for schedule statuses; anything else shows as ready
+STATUS_LABELS = {
+    'Running': '🔄 Running',
+    'Completed': '✅ Completed',
+    'Failed': '❌ Failed'
+}
+
+# Default color scheme, shared by every scheduler panel
+_COLORS = {
+    'bg': '#F7F9FB',
+    'accent': '#1976D2',
+    'text': '#222B45',
+    'danger': '#D32F2F',
+    'success': '#43A047',
+    'warn': '#FFA000',
+    'sidebar': '#E9EEF3',
+    'tree_bg': '#E9EEF3',
+    'tree_fg': '#222B45',
+    'tree_sel': '#1976D2',
+    'border': '#D1D9E6',
+    'hover': '#E3E8EF',
+    'disabled': '#B0B7C3'
+}
 
 class Tooltip:
-    def __init__(self, widget, text):
-        self.widget = widget
-        self.text = text
-        self.tipwindow = None
-        widget.bind('<Enter>', self.show)
-        widget.bind('<Leave>', self.hide)
-    
-    def show(self, event=None):
-        if self.tipwindow or not self.text:
+    """Shared tooltip: a single Toplevel serves every widget attached via Tooltip.attach"""
+    _BINDTAG = 'SchedulerTooltip'
+    _toplevel = None
+    _label = None
+
+    @classmethod
+    def attach(cls, widget, text):
+        widget._tt_text = text
+        # One class-level binding per interpreter; widgets opt in through their bindtags
+        if not widget.bind_class(cls._BINDTAG):
+            widget.bind_class(cls._BINDTAG, '<Enter>', cls.show)
+            widget.bind_class(cls._BINDTAG, '<Leave>', cls.hide)
+        widget.bindtags((cls._BINDTAG,) + widget.bindtags())
+
+    @classmethod
+    def _ensure_toplevel(cls, widget):
+        if cls._toplevel is None or not cls._toplevel.winfo_exists():
+            cls._toplevel = tw = tk.Toplevel(widget._root())
+            tw.withdraw()
+            tw.wm_overrideredirect(True)
+            cls._label = tk.Label(tw, justify='left', background='#23272f', foreground='white', relief='solid', borderwidth=1, font=('Segoe UI', 10, 'normal'))
+            cls._label.pack(ipadx=8, ipady=4)
+        return cls._toplevel
+
+    @classmethod
+    def show(cls, event):
+        widget = event.widget
+        text = getattr(widget, '_tt_text', None)
+        if not text:
             return
-        x, y, _, cy = self.widget.bbox("insert")
-        x = x + self.widget.winfo_rootx() + 25
-        y = y + cy + self.widget.winfo_rooty() + 20
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
+        tw = cls._ensure_toplevel(widget)
+        x = widget.winfo_rootx() + 25
+        y = widget.winfo_rooty() + 20
+        cls._label.configure(text=text)
         tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(tw, text=self.text, justify='left', background='#23272f', foreground='white', relief='solid', borderwidth=1, font=('Segoe UI', 10, 'normal'))
-        label.pack(ipadx=8, ipady=4)
-    
-    def hide(self, event=None):
-        if self.tipwindow:
-            self.tipwindow.destroy()
-            self.tipwindow = None
+        tw.deiconify()
+
+    @classmethod
+    def hide(cls, event=None):
+        if cls._toplevel is not None and cls._toplevel.winfo_exists():
+            cls._toplevel.withdraw()
 
 class SchedulerPanel(ttk.Frame):
+    # (column, width, anchor) for each treeview
+    _SCHEDULE_COLUMNS = (
+        ('Type', 140, 'w'),
+        ('Time', 120, 'center'),
+        ('Day', 100, 'center'),
+        ('Enabled', 100, 'center'),
+        ('Last Run', 180, 'w'),
+        ('Status', 120, 'center'),
+        ('Actions', 120, 'center')
+    )
+    _UPCOMING_COLUMNS = (
+        ('Type', 140, 'w'),
+        ('Next Run', 180, 'w'),
+        ('Status', 120, 'center')
+    )
+    # Set once the shared Treeview style has been configured
+    _styles_configured = False
+    # Initial values for the Add Schedule form, restored on every open
+    _ADD_DEFAULTS = {'scan_type': 'Quick Scan', 'time': '09:00', 'frequency': 'Daily', 'enabled': True}
+
     def __init__(self, parent, scan_callback=None):
         super().__init__(parent)
         self.scan_callback = scan_callback
+        self._add_dialog = None
+        self._stats_pending = None
+        self._loop = _get_async_loop()
+        self._minute_cache = (None, None)  # (epoch minute, formatted string)
+        self._configure_styles()
         self._create_widgets()
         self.refresh()
 
+    def _configure_styles(self):
+        """Configure the shared Treeview style once rather than per tree or per refresh"""
+        if SchedulerPanel._styles_configured:
+            return
+        # Row height and font sized to prevent overlapping
+        style = ttk.Style()
+        style.configure('Treeview', rowheight=28, font=('Segoe UI', 11))
+        SchedulerPanel._styles_configured = True
+
     def _create_widgets(self):
         """Create the main scheduler interface"""
         colors = self._get_colors()
@@ -42,17 +154,17 @@ class SchedulerPanel(ttk.Frame):
         # Header
         header_frame = ttk.Frame(self, style='TFrame')
         header_frame.pack(fill='x', pady=(10, 0))
-        icon = ttk.Label(header_frame, text='📅', font=('Segoe UI Emoji', 32), background=colors['bg'], foreground=colors['accent'])
-        icon.pack(side='left', padx=(20, 10))
-        title = ttk.Label(header_frame, text='Scan Scheduler', font=('Segoe UI', 22, 'bold'), background=colors['bg'], foreground=colors['accent'])
-        title.pack(side='left', pady=8)
-        subtitle = ttk.Label(header_frame, text='Automate scan routines and monitor performance', font=('Segoe UI', 12, 'italic'), background=colors['bg'], foreground=colors['text'])
-        subtitle.pack(side='left', padx=20, pady=8)
+        self._icon_label = ttk.Label(header_frame, text='📅', font=('Segoe UI Emoji', 32), background=colors['bg'], foreground=colors['accent'])
+        self._icon_label.pack(side='left', padx=(20, 10))
+        self._title_label = ttk.Label(header_frame, text='Scan Scheduler', font=('Segoe UI', 22, 'bold'), background=colors['bg'], foreground=colors['accent'])
+        self._title_label.pack(side='left', pady=8)
+        self._subtitle_label = ttk.Label(header_frame, text='Automate scan routines and monitor performance', font=('Segoe UI', 12, 'italic'), background=colors['bg'], foreground=colors['text'])
+        self._subtitle_label.pack(side='left', padx=20, pady=8)
         
         # Add new schedule button
         add_btn = ttk.Button(header_frame, text='➕ Add Schedule', style='Accent.TButton', command=self._add_new_schedule)
         add_btn.pack(side='right', padx=20)
-        Tooltip(add_btn, 'Add New Scan Schedule')
+        Tooltip.attach(add_btn, 'Add New Scan Schedule')
 
         # Main container with left and right panels
         main_frame = ttk.Frame(self)
@@ -79,40 +191,29 @@ class SchedulerPanel(ttk.Frame):
         # Create treeview for scheduled scans
         columns = ('Type', 'Time', 'Day', 'Enabled', 'Last Run', 'Status', 'Actions')
         self.schedules_tree = ttk.Treeview(schedules_frame, columns=columns, show='headings', height=15, style='Treeview')
-        
-        # Configure row height and styling to prevent overlapping
-        style = ttk.Style()
-        style.configure('Treeview', rowheight=28, font=('Segoe UI', 11))
+        self._rendered = {}  # schedule id -> (values, stripe tag) currently shown in schedules_tree
+        self.schedules_tree.tag_configure('oddrow', background=_COLORS['hover'])
+        self._schedules = {}  # schedule id -> values tuple for every schedule (source of truth)
         
         # Configure columns
-        column_configs = [
-            ('Type', 140, 'w'),
-            ('Time', 120, 'center'),
-            ('Day', 100, 'center'),
-            ('Enabled', 100, 'center'),
-            ('Last Run', 180, 'w'),
-            ('Status', 120, 'center'),
-            ('Actions', 120, 'center')
-        ]
-        
-        for col, width, anchor in column_configs:
+        for col, width, anchor in self._SCHEDULE_COLUMNS:
             self.schedules_tree.heading(col, text=col, anchor=anchor)
             self.schedules_tree.column(col, width=width, anchor=anchor, stretch=True)
         
-        # Add scrollbars for scheduled scans
-        vscroll = ttk.Scrollbar(schedules_frame, orient='vertical', command=self.schedules_tree.yview)
-        hscroll = ttk.Scrollbar(schedules_frame, orient='horizontal', command=self.schedules_tree.xview)
-        self.schedules_tree.configure(yscrollcommand=vscroll.set, xscrollcommand=hscroll.set)
-        self.schedules_tree.pack(side='left', fill='both', expand=True)
-        vscroll.pack(side='right', fill='y')
-        hscroll.pack(side='bottom', fill='x')
+        # Add a scrollbar for scheduled scans (hidden while the rows fit); the columns stretch to the width
+        vscroll = AutoScrollbar(schedules_frame, orient='vertical', command=self.schedules_tree.yview)
+        self.schedules_tree.configure(yscrollcommand=vscroll.set)
+        schedules_frame.columnconfigure(0, weight=1)
+        schedules_frame.rowconfigure(0, weight=1)
+        self.schedules_tree.grid(row=0, column=0, sticky='nsew')
+        vscroll.grid(row=0, column=1, sticky='ns')
         
         # Bind selection event
         self.schedules_tree.bind('<<TreeviewSelect>>', self._on_schedule_select)
         
         # Control buttons frame
         controls_frame = ttk.Frame(schedules_frame)
-        controls_frame.pack(fill='x', pady=(10, 0))
+        controls_frame.grid(row=1, column=0, columnspan=2, sticky='ew', pady=(10, 0))
         
         self.run_now_btn = ttk.Button(controls_frame, text='▶️ Run Now', style='Success.TButton', command=self._run_selected_schedule)
         self.run_now_btn.pack(side='left', padx=(0, 10))
@@ -157,39 +258,28 @@ class SchedulerPanel(ttk.Frame):
         # Create treeview for upcoming scans
         upcoming_columns = ('Type', 'Next Run', 'Status')
         self.upcoming_tree = ttk.Treeview(upcoming_frame, columns=upcoming_columns, show='headings', height=8, style='Treeview')
-        
-        # Configure row height and styling to prevent overlapping
-        style = ttk.Style()
-        style.configure('Treeview', rowheight=28, font=('Segoe UI', 11))
+        self._upcoming_rendered = {}  # upcoming id -> (values, stripe tag) currently shown in upcoming_tree
+        self.upcoming_tree.tag_configure('oddrow', background=_COLORS['hover'])
         
         # Configure columns
-        upcoming_column_configs = [
-            ('Type', 140, 'w'),
-            ('Next Run', 180, 'w'),
-            ('Status', 120, 'center')
-        ]
-        
-        for col, width, anchor in upcoming_column_configs:
+        for col, width, anchor in self._UPCOMING_COLUMNS:
             self.upcoming_tree.heading(col, text=col, anchor=anchor)
             self.upcoming_tree.column(col, width=width, anchor=anchor, stretch=True)
         
-        # Add scrollbars for upcoming scans
-        vscroll2 = ttk.Scrollbar(upcoming_frame, orient='vertical', command=self.upcoming_tree.yview)
-        hscroll2 = ttk.Scrollbar(upcoming_frame, orient='horizontal', command=self.upcoming_tree.xview)
-        self.upcoming_tree.configure(yscrollcommand=vscroll2.set, xscrollcommand=hscroll2.set)
-        self.upcoming_tree.pack(side='left', fill='both', expand=True)
-        vscroll2.pack(side='right', fill='y')
-        hscroll2.pack(side='bottom', fill='x')
+        # Add a scrollbar for upcoming scans (hidden while the rows fit)
+        vscroll2 = AutoScrollbar(upcoming_frame, orient='vertical', command=self.upcoming_tree.yview)
+        self.upcoming_tree.configure(yscrollcommand=vscroll2.set)
+        upcoming_frame.columnconfigure(0, weight=1)
+        upcoming_frame.rowconfigure(0, weight=1)
+        self.upcoming_tree.grid(row=0, column=0, sticky='nsew')
+        vscroll2.grid(row=0, column=1, sticky='ns')
 
     def _load_scheduled_scans(self):
         """Load scheduled scans into the treeview"""
-        # Clear existing items
-        for item in self.schedules_tree.get_children():
-            self.schedules_tree.delete(item)
-        
         # Create some mock schedules for demonstration
         mock_schedules = [
             {
+                'id': 'schedule-quick',
                 'scan_type': 'Quick Scan',
                 'time': '09:00',
                 'day': 'Daily',
@@ -198,6 +288,7 @@ class SchedulerPanel(ttk.Frame):
                 'status': 'Completed'
             },
             {
+                'id': 'schedule-custom',
                 'scan_type': 'Custom Scan',
                 'time': '14:30',
                 'day': 'Weekly',
@@ -207,23 +298,17 @@ class SchedulerPanel(ttk.Frame):
             }
         ]
         
-        for i, schedule in enumerate(mock_schedules):
+        for schedule in mock_schedules:
+            self._ingest_schedule(schedule)
+        
+        rows = []
+        for schedule in mock_schedules:
             # Format time
             time_str = schedule.get('time', '09:00')
             day_str = schedule.get('day', 'Daily')
             enabled_str = '✓' if schedule.get('enabled', True) else '✗'
-            last_run = schedule.get('last_run', 'Never')
-            status = schedule.get('status', 'Ready')
-            
-            # Color code status
-            if status == 'Running':
-                status = '🔄 Running'
-            elif status == 'Completed':
-                status = '✅ Completed'
-            elif status == 'Failed':
-                status = '❌ Failed'
-            else:
-                status = '⏳ Ready'
+            last_run = schedule['_last_run_fmt']
+            status = STATUS_LABELS.get(schedule.get('status'), '⏳ Ready')
             
             values = (
                 schedule.get('scan_type', 'Quick Scan'),
@@ -234,10 +319,20 @@ class SchedulerPanel(ttk.Frame):
                 status,
                 '▶️ ✏️ 🗑️'  # Action buttons placeholder
             )
-            
-            # Add with alternating row colors
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.schedules_tree.insert('', 'end', values=values, tags=(tag,))
+            rows.append((schedule['id'], values))
+        
+        self._schedules = dict(rows)
+        self._render_schedules()
+
+    def _ingest_schedule(self, schedule):
+        """Precompute display-only fields once when a schedule enters the model"""
+        last_run = schedule.get('last_run')
+        schedule['_last_run_fmt'] = self._format_time(last_run) if last_run else 'Never'
+        return schedule
+
+    def _render_schedules(self):
+        """Show the schedule model in the treeview"""
+        self._sync_tree(self.schedules_tree, self._rendered, list(self._schedules.items()))
 
     def _load_scan_statistics(self):
         """Load scan statistics into the dashboard"""
@@ -256,26 +351,72 @@ class SchedulerPanel(ttk.Frame):
         # Load upcoming scans
         self._load_upcoming_scans()
 
+    def _schedule_stats_refresh(self):
+        """Coalesce a burst of statistics refresh requests into one idle-time update"""
+        if self._stats_pending is None:
+            self._stats_pending = self.after_idle(self._do_stats_refresh)
+
+    def _do_stats_refresh(self):
+        self._stats_pending = None
+        self._load_scan_statistics()
+
     def _load_upcoming_scans(self):
         """Load upcoming scans into the treeview"""
-        # Clear existing items
-        for item in self.upcoming_tree.get_children():
-            self.upcoming_tree.delete(item)
-        
         # Create mock upcoming scans
         mock_upcoming = [
-            {'type': 'Quick Scan', 'next_run': '2024-01-16 09:00', 'status': 'Scheduled'},
-            {'type': 'Custom Scan', 'next_run': '2024-01-20 14:30', 'status': 'Scheduled'}
+            {'id': 'upcoming-quick', 'type': 'Quick Scan', 'next_run': '2024-01-16 09:00', 'status': 'Scheduled'},
+            {'id': 'upcoming-custom', 'type': 'Custom Scan', 'next_run': '2024-01-20 14:30', 'status': 'Scheduled'}
         ]
         
-        for i, scan in enumerate(mock_upcoming):
+        rows = []
+        for scan in mock_upcoming:
             values = (
                 scan['type'],
                 scan['next_run'],
                 scan['status']
             )
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.upcoming_tree.insert('', 'end', values=values, tags=(tag,))
+            rows.append((scan['id'], values))
+        
+        self._sync_tree(self.upcoming_tree, self._upcoming_rendered, rows)
+
+    def _sync_tree(self, tree, rendered, rows):
+        """Bring a treeview in line with rows of (id, values), touching only rows that changed
+
+        rendered maps id -> (values, stripe tag).
+        """
+        seen = {iid for iid, _ in rows}
+        removed = [iid for iid in rendered if iid not in seen]
+        changed = []
+        for index, (iid, values) in enumerate(rows):
+            state = (values, 'oddrow' if index & 1 else ())
+            if rendered.get(iid) != state:
+                changed.append((index, iid, state))
+        if not changed and not removed:
+            return
+        with _suspended(tree):
+            for iid in removed:
+                tree.delete(iid)
+                del rendered[iid]
+            for index, iid, state in changed:
+                values, tags = state
+                if iid not in rendered:
+                    tree.insert('', index, iid=iid, values=values, tags=tags)
+                else:
+                    # Straight to Tcl; skips ttk's option-dict wrapping for the common update path
+                    tree.tk.call(tree, 'item', iid, '-values', values, '-tags', tags)
+                rendered[iid] = state
+
+    def _set_schedule_cell(self, iid, column, value):
+        """Set one cell of a schedule in the model and the treeview"""
+        values = self._schedules.get(iid)
+        if values is None:
+            return
+        idx = self.schedules_tree['columns'].index(column)
+        values = values[:idx] + (value,) + values[idx + 1:]
+        self._schedules[iid] = values
+        if iid in self._rendered:
+            self.schedules_tree.set(iid, column, value)
+            self._rendered[iid] = (values, self._rendered[iid][1])
 
     def _on_schedule_select(self, event):
         """Handle schedule selection"""
@@ -293,59 +434,89 @@ class SchedulerPanel(ttk.Frame):
 
     def _add_new_schedule(self):
         """Add a new scan schedule"""
-        # Create a simple dialog for adding new schedule
-        dialog = tk.Toplevel(self)
-        dialog.title("Add New Scan Schedule")
-        dialog.geometry("400x300")
-        dialog.configure(bg=self._get_colors()['bg'])
-        dialog.transient(self)
-        dialog.grab_set()
+        if self._add_dialog is None:
+            self._build_add_dialog()
+        else:
+            # Reuse the hidden dialog; just reset the form
+            for key, value in self._ADD_DEFAULTS.items():
+                self._add_vars[key].set(value)
+        dialog = self._add_dialog
         
         # Center the dialog
         dialog.geometry("+%d+%d" % (self.winfo_rootx() + 50, self.winfo_rooty() + 50))
+        dialog.deiconify()
+        # transient() is set once at build time; Tk cannot hold a grab on a withdrawn
+        # window, so the grab is the only modal state re-established per open
+        dialog.grab_set()
+        self._add_first_entry.focus_set()
+
+    def _build_add_dialog(self):
+        """Create the Add Schedule dialog once, hidden; later opens just deiconify it"""
+        self._add_dialog = dialog = tk.Toplevel(self)
+        dialog.withdraw()
+        dialog.title("Add New Scan Schedule")
+        dialog.geometry("400x300")
+        dialog.configure(bg=_COLORS['bg'])
+        dialog.transient(self)
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_add_dialog)
+        dialog.bind('<Destroy>', self._on_add_dialog_destroy)
+        
+        self._add_vars = {
+            'scan_type': tk.StringVar(value=self._ADD_DEFAULTS['scan_type']),
+            'time': tk.StringVar(value=self._ADD_DEFAULTS['time']),
+            'frequency': tk.StringVar(value=self._ADD_DEFAULTS['frequency']),
+            'enabled': tk.BooleanVar(value=self._ADD_DEFAULTS['enabled'])
+        }
         
         # Schedule type
         ttk.Label(dialog, text="Scan Type:", font=('Segoe UI', 12)).pack(pady=5)
-        scan_type_var = tk.StringVar(value="Quick Scan")
-        scan_type_combo = ttk.Combobox(dialog, textvariable=scan_type_var, 
+        scan_type_combo = ttk.Combobox(dialog, textvariable=self._add_vars['scan_type'], 
                                       values=["Quick Scan", "Custom Scan"],
                                       state="readonly")
         scan_type_combo.pack(pady=5)
         
         # Time
         ttk.Label(dialog, text="Time:", font=('Segoe UI', 12)).pack(pady=5)
-        time_var = tk.StringVar(value="09:00")
-        time_entry = ttk.Entry(dialog, textvariable=time_var)
+        time_entry = ttk.Entry(dialog, textvariable=self._add_vars['time'])
         time_entry.pack(pady=5)
+        self._add_first_entry = time_entry
         
         # Day/Frequency
         ttk.Label(dialog, text="Frequency:", font=('Segoe UI', 12)).pack(pady=5)
-        frequency_var = tk.StringVar(value="Daily")
-        frequency_combo = ttk.Combobox(dialog, textvariable=frequency_var,
+        frequency_combo = ttk.Combobox(dialog, textvariable=self._add_vars['frequency'],
                                       values=["Daily", "Weekly", "Monthly", "Once"],
                                       state="readonly")
         frequency_combo.pack(pady=5)
         
         # Enable checkbox
-        enabled_var = tk.BooleanVar(value=True)
-        enabled_check = ttk.Checkbutton(dialog, text="Enable Schedule", variable=enabled_var)
+        enabled_check = ttk.Checkbutton(dialog, text="Enable Schedule", variable=self._add_vars['enabled'])
         enabled_check.pack(pady=10)
         
         # Buttons
         button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=20)
         
-        def save_schedule():
-            # For now, just refresh the display with the new schedule
-            # In a real implementation, this would save to a database or file
-            messagebox.showinfo("Success", f"New {scan_type_var.get()} schedule added successfully!")
-            dialog.destroy()
-            # Refresh the display
-            self._load_scheduled_scans()
-            self._load_scan_statistics()
-        
-        ttk.Button(button_frame, text="Save", style='Accent.TButton', command=save_schedule).pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Save", style='Accent.TButton', command=self._save_new_schedule).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self._hide_add_dialog).pack(side='left', padx=5)
+
+    def _save_new_schedule(self):
+        # For now, just refresh the display with the new schedule
+        # In a real implementation, this would save to a database or file
+        messagebox.showinfo("Success", f"New {self._add_vars['scan_type'].get()} schedule added successfully!")
+        self._hide_add_dialog()
+        # Refresh the display
+        self._load_scheduled_scans()
+        self._schedule_stats_refresh()
+
+    def _hide_add_dialog(self):
+        if self._add_dialog is not None:
+            self._add_dialog.grab_release()
+            self._add_dialog.withdraw()
+
+    def _on_add_dialog_destroy(self, event):
+        # <Destroy> also fires for the dialog's children; only forget the dialog itself
+        if event.widget is self._add_dialog:
+            self._add_dialog = None
 
     def _run_selected_schedule(self):
         """Run the selected schedule immediately"""
@@ -357,17 +528,29 @@ class SchedulerPanel(ttk.Frame):
         schedule_type = item['values'][0]
         
         # Update status to running
-        self.schedules_tree.set(selection[0], 'Status', '🔄 Running')
-        
-        # Simulate running the scan
-        def run_scan():
-            import time
-            time.sleep(2)  # Simulate scan time
-            self.schedules_tree.set(selection[0], 'Status', '✅ Completed')
-            self.schedules_tree.set(selection[0], 'Last Run', datetime.now().strftime('%Y-%m-%d %H:%M'))
-            self._load_scan_statistics()
+        self._set_schedule_cell(selection[0], 'Status', STATUS_LABELS['Running'])
         
-        threading.Thread(target=run_scan, daemon=True).start()
+        # Simulate the scan on the shared asyncio loop; results come back through after()
+        asyncio.run_coroutine_threadsafe(self._simulate_scan(selection[0]), self._loop)
+
+    async def _simulate_scan(self, iid):
+        await asyncio.sleep(2)  # Simulate scan time
+        self.after(0, self._finish_run, iid)
+
+    def _finish_run(self, iid):
+        """Mark a schedule as completed (always runs on the Tk thread)"""
+        if not self.winfo_exists() or iid not in self._schedules:
+            return
+        self._set_schedule_cell(iid, 'Status', STATUS_LABELS['Completed'])
+        self._set_schedule_cell(iid, 'Last Run', self._now_minute_str())
+        self._schedule_stats_refresh()
+
+    def _now_minute_str(self):
+        """Current time as 'YYYY-MM-DD HH:MM', reformatted at most once per minute"""
+        minute = int(time.time() // 60)
+        if self._minute_cache[0] != minute:
+            self._minute_cache = (minute, datetime.fromtimestamp(minute * 60).strftime('%Y-%m-%d %H:%M'))
+        return self._minute_cache[1]
 
     def _edit_selected_schedule(self):
         """Edit the selected schedule"""
@@ -389,17 +572,23 @@ class SchedulerPanel(ttk.Frame):
         
         if messagebox.askyesno("Delete Schedule", f"Are you sure you want to delete the '{schedule_type}' schedule?"):
             # Remove from treeview
-            self.schedules_tree.delete(selection[0])
+            self._schedules.pop(selection[0], None)
+            self._render_schedules()
             # In a real implementation, you would also remove from the scheduler manager
-            self._load_scan_statistics()
+            self._schedule_stats_refresh()
 
-    def _refresh_panel(self):
-        """Refresh the entire panel"""
-        for widget in self.winfo_children():
-            widget.destroy()
-        self._create_widgets()
+    def _apply_theme(self):
+        """Recolor the existing header and statistics widgets in place"""
+        colors = self._get_colors()
+        self._icon_label.configure(background=colors['bg'], foreground=colors['accent'])
+        self._title_label.configure(background=colors['bg'], foreground=colors['accent'])
+        self._subtitle_label.configure(background=colors['bg'], foreground=colors['text'])
+        self.failed_scans_label.configure(foreground=colors['danger'])
+        self.schedules_tree.tag_configure('oddrow', background=colors['hover'])
+        self.upcoming_tree.tag_configure('oddrow', background=colors['hover'])
 
     def _format_time(self, t):
+        # One-shot formatter; used at ingest time, not per render
         if not t:
             return '-'
         try:
@@ -410,22 +599,12 @@ class SchedulerPanel(ttk.Frame):
 
     def _get_colors(self):
         """Get color scheme based on theme"""
-        # For now, use a default color scheme
-        return {
-            'bg': '#F7F9FB',
-            'accent': '#1976D2',
-            'text': '#222B45',
-            'danger': '#D32F2F',
-            'success': '#43A047',
-            'warn': '#FFA000',
-            'sidebar': '#E9EEF3',
-            'tree_bg': '#E9EEF3',
-            'tree_fg': '#222B45',
-            'tree_sel': '#1976D2',
-            'border': '#D1D9E6',
-            'hover': '#E3E8EF',
-            'disabled': '#B0B7C3'
-        }
+        return _COLORS
+
+    def _set_theme(self, colors):
+        """Swap the shared color scheme in place and recolor the existing widgets"""
+        _COLORS.update(colors)
+        self._apply_theme()
 
     def refresh(self):
         """Refresh the panel data"""
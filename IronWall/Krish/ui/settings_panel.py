@@ -4,28 +4,186 @@ Comprehensive settings interface with all major antivirus configurations
 """
 
 import tkinter as tk
-from tkinter import messagebox, filedialog, simpledialog
+from tkinter import messagebox
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import json
 import os
+import functools
+import copy
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 from utils.settings_manager import get_settings_manager
 from utils.color_palette import get_color_palette
 from utils import scan_history
-from ui.theme_preview import ThemeSelectorWidget, ColorPickerWidget
 import sys
 
+TTKBOOTSTRAP_THEMES = ("flatly", "morph", "cyborg", "darkly", "solar", "superhero", "cosmo", "journal")
+
+@functools.lru_cache(maxsize=1)
+def _all_themes():
+    """Return every predefined and custom color theme (cached until themes change)"""
+    return get_color_palette().get_all_themes()
+
 class SettingsPanel:
     """Comprehensive settings panel for IronWall Antivirus"""
     
+    # Notebook tabs in display order: (title, tab name)
+    _TABS = (
+        ("🛡️ Protection", "protection"),
+        ("🧪 Scan Control", "scanning"),
+        ("📅 Scheduling", "scheduling"),
+        ("🔔 Notifications", "notifications"),
+        ("🌐 Updates & Cloud", "updates"),
+        ("📊 Performance", "performance"),
+        ("🧼 Quarantine", "quarantine"),
+        ("🔒 Privacy", "privacy"),
+        ("🎨 Appearance", "appearance"),
+    )
+    
+    # Settings sections shown on each tab: (section title, [(setting_id, label, category, control_type, *args)])
+    _TAB_SPEC = {
+        "protection": [
+            ("Real-time Protection", [
+                ("real_time_protection", "Enable Real-time Protection", "protection", "checkbox"),
+                ("firewall_protection", "Enable Firewall Protection", "protection", "checkbox"),
+                ("usb_protection", "USB & External Drive Protection", "protection", "checkbox"),
+                ("safe_browsing", "Safe Browsing Protection", "protection", "checkbox"),
+                ("webcam_microphone_control", "Webcam & Microphone Access Control", "protection", "checkbox"),
+            ]),
+            ("Heuristic Scanning", [
+                ("heuristic_scanning", "Heuristic Level", "protection", "combobox", 
+                 ["Low", "Medium", "High"])
+            ]),
+        ],
+        "scanning": [
+            ("Scan Configuration", [
+                ("default_scan_type", "Default Scan Type", "scanning", "combobox",
+                 ["Quick", "Full", "Deep", "Custom"]),
+                ("scan_compressed_files", "Scan Compressed Files", "scanning", "checkbox"),
+                ("scan_startup_programs", "Scan Startup Programs", "scanning", "checkbox"),
+            ]),
+        ],
+        "scheduling": [
+            ("Scheduled Scans", [
+                ("enable_scheduled_scans", "Enable Scheduled Scans", "scheduling", "checkbox"),
+                ("scan_frequency", "Scan Frequency", "scheduling", "combobox",
+                 ["Daily", "Weekly", "Monthly"]),
+                ("auto_delete_threats", "Auto-delete Threats", "scheduling", "checkbox"),
+            ]),
+        ],
+        "notifications": [
+            ("Notification Settings", [
+                ("threat_alerts", "Threat Alerts", "notifications", "checkbox"),
+                ("scan_results_summary", "Scan Results Summary", "notifications", "checkbox"),
+                ("silent_mode", "Silent Mode (Log-only)", "notifications", "checkbox"),
+                ("notification_sound", "Notification Sound", "notifications", "checkbox"),
+            ]),
+        ],
+        "updates": [
+            ("Automatic Updates", [
+                ("auto_update_definitions", "Auto-update Virus Definitions", "updates", "checkbox"),
+                ("auto_update_app", "Auto-update Application", "updates", "checkbox"),
+                ("cloud_threat_detection", "Cloud Threat Detection", "updates", "checkbox"),
+            ]),
+        ],
+        "performance": [
+            ("Performance Options", [
+                ("ram_optimization", "RAM Optimization", "performance", "checkbox"),
+                ("background_scan", "Background Scan", "performance", "checkbox"),
+                ("idle_scan_mode", "Idle Scan Mode", "performance", "checkbox"),
+                ("battery_saver_mode", "Battery Saver Mode", "performance", "checkbox"),
+            ]),
+        ],
+        "quarantine": [
+            ("Quarantine Settings", [
+                ("enable_file_submission", "Enable Manual File Submission", "quarantine", "checkbox"),
+            ]),
+        ],
+        "privacy": [
+            ("Data & Privacy", [
+                ("data_sharing", "Anonymous Usage Statistics", "privacy", "checkbox"),
+                ("auto_log_clearing", "Auto-log Clearing", "privacy", "checkbox"),
+                ("block_telemetry", "Block Telemetry from Other Apps", "privacy", "checkbox"),
+            ]),
+        ],
+        "appearance": [
+            ("Interface Options", [
+                ("high_contrast", "High Contrast Mode", "appearance", "checkbox"),
+                ("animations", "Enable Animations", "appearance", "checkbox"),
+            ]),
+        ],
+    }
+    
+    # Variable-backed settings: (category, key, attribute holding the Tk variable)
+    _SAVE_MAP = (
+        ("protection", "real_time_protection", "real_time_protection_var"),
+        ("protection", "firewall_protection", "firewall_protection_var"),
+        ("protection", "usb_protection", "usb_protection_var"),
+        ("protection", "safe_browsing", "safe_browsing_var"),
+        ("protection", "webcam_microphone_control", "webcam_microphone_control_var"),
+        ("protection", "heuristic_scanning", "heuristic_scanning_var"),
+        ("scanning", "default_scan_type", "default_scan_type_var"),
+        ("scanning", "scan_compressed_files", "scan_compressed_files_var"),
+        ("scanning", "scan_startup_programs", "scan_startup_programs_var"),
+        ("scheduling", "enable_scheduled_scans", "enable_scheduled_scans_var"),
+        ("scheduling", "scan_frequency", "scan_frequency_var"),
+        ("scheduling", "scan_time", "scan_time_var"),
+        ("scheduling", "auto_delete_threats", "auto_delete_threats_var"),
+        ("notifications", "threat_alerts", "threat_alerts_var"),
+        ("notifications", "scan_results_summary", "scan_results_summary_var"),
+        ("notifications", "silent_mode", "silent_mode_var"),
+        ("notifications", "notification_sound", "notification_sound_var"),
+        ("updates", "auto_update_definitions", "auto_update_definitions_var"),
+        ("updates", "auto_update_app", "auto_update_app_var"),
+        ("updates", "cloud_threat_detection", "cloud_threat_detection_var"),
+        ("performance", "cpu_usage_limit", "cpu_limit_var"),
+        ("performance", "ram_optimization", "ram_optimization_var"),
+        ("performance", "background_scan", "background_scan_var"),
+        ("performance", "idle_scan_mode", "idle_scan_mode_var"),
+        ("performance", "battery_saver_mode", "battery_saver_mode_var"),
+        ("quarantine", "auto_delete_after_days", "auto_delete_var"),
+        ("quarantine", "quarantine_folder", "quarantine_folder_var"),
+        ("quarantine", "max_quarantine_size_mb", "max_size_var"),
+        ("quarantine", "enable_file_submission", "enable_file_submission_var"),
+        ("privacy", "data_sharing", "data_sharing_var"),
+        ("privacy", "log_retention_days", "log_retention_var"),
+        ("privacy", "auto_log_clearing", "auto_log_clearing_var"),
+        ("privacy", "block_telemetry", "block_telemetry_var"),
+        ("appearance", "ttkbootstrap_theme", "ttkbootstrap_theme_var"),
+        ("appearance", "font_size", "font_size_var"),
+        ("appearance", "high_contrast", "high_contrast_var"),
+        ("appearance", "animations", "animations_var"),
+        ("appearance", "language", "language_var"),
+        ("appearance", "use_custom_colors", "use_custom_colors_var"),
+        ("appearance", "sync_with_system", "sync_system_var"),
+    )
+    
+    # How long a tab may stay hidden before its widgets are released
+    _UNLOAD_DELAY_MS = 300000
+    
     def __init__(self, parent, main_window):
         self.parent = parent
         self.main_window = main_window
         self.settings_manager = get_settings_manager()
         
+        # Controls exist only while their tab is built; until then they are None
+        for _, _, attr in self._SAVE_MAP:
+            setattr(self, attr, None)
+        self.theme_selector = self.color_swatches = self.preview_area = None
+        self.files_listbox = self.folders_listbox = self.extensions_listbox = None
+        self.cpu_label = None
+        
+        # Snapshot of all settings that Tk variables take their initial values from
+        self._settings = copy.deepcopy(self.settings_manager.get_all_settings())
+        self._vars = {}
+        self._preview_job = None
+        self._color_dirty = {}
+        self._color_flush_id = None
+        self._exclusions_flush_id = None
+        
         # Create the main settings window
         self.create_settings_window()
         
@@ -34,6 +192,7 @@ class SettingsPanel:
         # Create main container
         self.main_frame = ttk.Frame(self.parent)
         self.main_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        self.main_frame.bind("<Destroy>", self._on_destroy)
         
         # Header
         header_frame = ttk.Frame(self.main_frame)
@@ -59,111 +218,123 @@ class SettingsPanel:
         self.notebook = ttk.Notebook(self.main_frame)
         self.notebook.pack(fill=BOTH, expand=True)
         
-        # Create all settings tabs
-        self.create_protection_tab()
-        self.create_scanning_tab()
-        self.create_scheduling_tab()
-        self.create_notifications_tab()
-        self.create_updates_tab()
-        self.create_performance_tab()
-        self.create_quarantine_tab()
-        self.create_privacy_tab()
-        self.create_appearance_tab()
-        
-    def create_protection_tab(self):
-        """Create Protection Settings tab"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="🛡️ Protection")
-        
-        # Real-time Protection
-        self.create_section(frame, "Real-time Protection", [
-            ("real_time_protection", "Enable Real-time Protection", "protection", "checkbox"),
-            ("firewall_protection", "Enable Firewall Protection", "protection", "checkbox"),
-            ("usb_protection", "USB & External Drive Protection", "protection", "checkbox"),
-            ("safe_browsing", "Safe Browsing Protection", "protection", "checkbox"),
-            ("webcam_microphone_control", "Webcam & Microphone Access Control", "protection", "checkbox"),
-        ])
-        
-        # Heuristic Scanning
-        self.create_section(frame, "Heuristic Scanning", [
-            ("heuristic_scanning", "Heuristic Level", "protection", "combobox", 
-             ["Low", "Medium", "High"])
-        ])
-        
-    def create_scanning_tab(self):
+        # Add placeholder frames for every tab; content is built on first activation
+        self._tab_builders = {}
+        self._tab_built = set()
+        self._unload_jobs = {}
+        self._preload_scheduled = set()
+        for title, name in self._TABS:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            # Tabs without custom widgets are built straight from _TAB_SPEC
+            self._tab_builders[str(frame)] = (getattr(self, f"create_{name}_tab", None)
+                                              or functools.partial(self._build_sections, name))
+            if name == "appearance":
+                self._appearance_tab = str(frame)
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.notebook.bind("<Motion>", self._on_notebook_motion)
+        
+        # Only the initially visible tab is built up front
+        self._current_tab = str(self.notebook.tabs()[0])
+        self._build_tab(self._current_tab)
+    
+    def _on_destroy(self, event):
+        """Write pending edits when the settings panel is closed"""
+        if event.widget is not self.main_frame:
+            return
+        self._flush_exclusions()
+        if self._color_flush_id:
+            self.parent.after_cancel(self._color_flush_id)
+            self._flush_colors()
+    
+    def _on_tab_changed(self, event):
+        """Build the selected tab on demand and schedule the previous one for unloading"""
+        tab_id = str(self.notebook.select())
+        previous, self._current_tab = self._current_tab, tab_id
+        
+        job = self._unload_jobs.pop(tab_id, None)
+        if job:
+            self.parent.after_cancel(job)
+        if previous != tab_id and previous in self._tab_built and previous not in self._unload_jobs:
+            self._unload_jobs[previous] = self.parent.after(
+                self._UNLOAD_DELAY_MS, self._maybe_unload, previous)
+        
+        self._build_tab(tab_id)
+    
+    def _on_notebook_motion(self, event):
+        """Preload the Appearance tab while the pointer hovers over its header"""
+        tab_id = self._appearance_tab
+        if tab_id in self._tab_built or tab_id in self._preload_scheduled:
+            return
+        if not self.notebook.identify(event.x, event.y):
+            return
+        try:
+            index = self.notebook.index(f"@{event.x},{event.y}")
+        except tk.TclError:
+            return
+        if index == self.notebook.index(tab_id):
+            self._preload_scheduled.add(tab_id)
+            self.parent.after_idle(self._build_tab, tab_id)
+    
+    def _build_tab(self, tab_id):
+        """Run the builder for a notebook tab unless it has already been built"""
+        tab_id = str(tab_id)
+        if tab_id in self._tab_built or tab_id not in self._tab_builders:
+            return
+        self._tab_built.add(tab_id)
+        self._tab_builders[tab_id](self.notebook.nametowidget(tab_id))
+    
+    def _maybe_unload(self, tab_id):
+        """Destroy a tab's widgets if it is still inactive
+
+        Unsaved values survive because the rebuilt controls reuse the same Tk variables.
+        """
+        self._unload_jobs.pop(tab_id, None)
+        if tab_id == self._current_tab or tab_id not in self._tab_built:
+            return
+        
+        for child in self.notebook.nametowidget(tab_id).winfo_children():
+            child.destroy()
+        self._forget_widgets(tab_id)
+        self._tab_built.discard(tab_id)
+        self._preload_scheduled.discard(tab_id)
+    
+    def _forget_widgets(self, tab_id):
+        """Reset attributes that still reference widgets of an unloaded tab"""
+        prefix = tab_id + "."
+        for name, value in list(vars(self).items()):
+            widgets = value.values() if isinstance(value, dict) else (value,)
+            if any(isinstance(w, tk.Misc) and str(w).startswith(prefix) for w in widgets):
+                setattr(self, name, None)
+        
+    def create_scanning_tab(self, frame):
         """Create Scanning Control tab"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="🧪 Scan Control")
-        
-        # Scan Types
-        self.create_section(frame, "Scan Configuration", [
-            ("default_scan_type", "Default Scan Type", "scanning", "combobox",
-             ["Quick", "Full", "Deep", "Custom"]),
-            ("scan_compressed_files", "Scan Compressed Files", "scanning", "checkbox"),
-            ("scan_startup_programs", "Scan Startup Programs", "scanning", "checkbox"),
-        ])
+        self._build_sections("scanning", frame)
         
         # Exclusions
         self.create_exclusions_section(frame)
         
-    def create_scheduling_tab(self):
+    def create_scheduling_tab(self, frame):
         """Create Scan Scheduling tab"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="📅 Scheduling")
-        
-        # Scheduled Scans
-        self.create_section(frame, "Scheduled Scans", [
-            ("enable_scheduled_scans", "Enable Scheduled Scans", "scheduling", "checkbox"),
-            ("scan_frequency", "Scan Frequency", "scheduling", "combobox",
-             ["Daily", "Weekly", "Monthly"]),
-            ("auto_delete_threats", "Auto-delete Threats", "scheduling", "checkbox"),
-        ])
+        self._build_sections("scheduling", frame)
         
         # Time Selection
         time_frame = ttk.LabelFrame(frame, text="Scan Time", padding=10)
         time_frame.pack(fill=X, pady=10, padx=10)
         
-        self.scan_time_var = tk.StringVar(
-            value=self.settings_manager.get_setting("scheduling", "scan_time", "02:00")
-        )
+        self.scan_time_var = self._var("scheduling", "scan_time", "02:00")
         ttk.Label(time_frame, text="Scan Time:").pack(side=LEFT)
         time_entry = ttk.Entry(time_frame, textvariable=self.scan_time_var, width=10)
         time_entry.pack(side=LEFT, padx=10)
         ttk.Label(time_frame, text="(HH:MM format)").pack(side=LEFT)
         
         # Store references to variables
-        self.scheduling_enable_var = getattr(self, 'enable_scheduled_scans_var', None)
-        self.scan_frequency_var = getattr(self, 'scan_frequency_var', None)
-        self.auto_delete_threats_var = getattr(self, 'auto_delete_threats_var', None)
-        
-    def create_notifications_tab(self):
-        """Create Notifications tab"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="🔔 Notifications")
-        
-        self.create_section(frame, "Notification Settings", [
-            ("threat_alerts", "Threat Alerts", "notifications", "checkbox"),
-            ("scan_results_summary", "Scan Results Summary", "notifications", "checkbox"),
-            ("silent_mode", "Silent Mode (Log-only)", "notifications", "checkbox"),
-            ("notification_sound", "Notification Sound", "notifications", "checkbox"),
-        ])
-        
-    def create_updates_tab(self):
-        """Create Updates & Cloud tab"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="🌐 Updates & Cloud")
+        self.scheduling_enable_var = self.enable_scheduled_scans_var
         
-        # Auto Updates
-        self.create_section(frame, "Automatic Updates", [
-            ("auto_update_definitions", "Auto-update Virus Definitions", "updates", "checkbox"),
-            ("auto_update_app", "Auto-update Application", "updates", "checkbox"),
-            ("cloud_threat_detection", "Cloud Threat Detection", "updates", "checkbox"),
-        ])
+    def create_updates_tab(self, frame):
+        """Create Updates & Cloud tab"""
+        self._build_sections("updates", frame)
         
         # Manual Update Button
         update_frame = ttk.Frame(frame)
@@ -171,19 +342,14 @@ class SettingsPanel:
         ttk.Button(update_frame, text="🔄 Check for Updates", 
                   style="info.TButton", command=self.check_for_updates).pack()
         
-    def create_performance_tab(self):
+    def create_performance_tab(self, frame):
         """Create Performance Settings tab"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="📊 Performance")
         
         # CPU Usage
         cpu_frame = ttk.LabelFrame(frame, text="CPU Usage Limiter", padding=10)
         cpu_frame.pack(fill=X, pady=10, padx=10)
         
-        self.cpu_limit_var = tk.IntVar(
-            value=self.settings_manager.get_setting("performance", "cpu_usage_limit", 50)
-        )
+        self.cpu_limit_var = self._var("performance", "cpu_usage_limit", 50, tk.IntVar)
         ttk.Label(cpu_frame, text="CPU Usage Limit:").pack(side=LEFT)
         cpu_scale = ttk.Scale(cpu_frame, from_=10, to=100, 
                              variable=self.cpu_limit_var, orient=HORIZONTAL)
@@ -191,48 +357,32 @@ class SettingsPanel:
         self.cpu_label = ttk.Label(cpu_frame, text=f"{self.cpu_limit_var.get()}%")
         self.cpu_label.pack(side=LEFT)
         
-        # Performance Options
-        self.create_section(frame, "Performance Options", [
-            ("ram_optimization", "RAM Optimization", "performance", "checkbox"),
-            ("background_scan", "Background Scan", "performance", "checkbox"),
-            ("idle_scan_mode", "Idle Scan Mode", "performance", "checkbox"),
-            ("battery_saver_mode", "Battery Saver Mode", "performance", "checkbox"),
-        ])
+        self._build_sections("performance", frame)
         
         # Bind CPU scale update
         cpu_scale.configure(command=self.update_cpu_label)
         
-    def create_quarantine_tab(self):
+    def create_quarantine_tab(self, frame):
         """Create Quarantine & Threat Control tab"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="🧼 Quarantine")
         
         # Auto-delete Settings
         auto_frame = ttk.LabelFrame(frame, text="Auto-delete Settings", padding=10)
         auto_frame.pack(fill=X, pady=10, padx=10)
         
-        self.auto_delete_var = tk.IntVar(
-            value=self.settings_manager.get_setting("quarantine", "auto_delete_after_days", 30)
-        )
+        self.auto_delete_var = self._var("quarantine", "auto_delete_after_days", 30, tk.IntVar)
         ttk.Label(auto_frame, text="Auto-delete threats after:").pack(side=LEFT)
         delete_spin = ttk.Spinbox(auto_frame, from_=1, to=365, 
                                  textvariable=self.auto_delete_var, width=10)
         delete_spin.pack(side=LEFT, padx=10)
         ttk.Label(auto_frame, text="days").pack(side=LEFT)
         
-        # Quarantine Settings
-        self.create_section(frame, "Quarantine Settings", [
-            ("enable_file_submission", "Enable Manual File Submission", "quarantine", "checkbox"),
-        ])
+        self._build_sections("quarantine", frame)
         
         # Quarantine Folder
         folder_frame = ttk.LabelFrame(frame, text="Quarantine Folder", padding=10)
         folder_frame.pack(fill=X, pady=10, padx=10)
         
-        self.quarantine_folder_var = tk.StringVar(
-            value=self.settings_manager.get_setting("quarantine", "quarantine_folder", "quarantine")
-        )
+        self.quarantine_folder_var = self._var("quarantine", "quarantine_folder", "quarantine")
         ttk.Entry(folder_frame, textvariable=self.quarantine_folder_var).pack(side=LEFT, fill=X, expand=True)
         ttk.Button(folder_frame, text="Browse", 
                   command=self.browse_quarantine_folder).pack(side=LEFT, padx=5)
@@ -241,87 +391,38 @@ class SettingsPanel:
         size_frame = ttk.LabelFrame(frame, text="Maximum Quarantine Size", padding=10)
         size_frame.pack(fill=X, pady=10, padx=10)
         
-        self.max_size_var = tk.IntVar(
-            value=self.settings_manager.get_setting("quarantine", "max_quarantine_size_mb", 1000)
-        )
+        self.max_size_var = self._var("quarantine", "max_quarantine_size_mb", 1000, tk.IntVar)
         ttk.Label(size_frame, text="Max size:").pack(side=LEFT)
         size_spin = ttk.Spinbox(size_frame, from_=100, to=10000, 
                                textvariable=self.max_size_var, width=10)
         size_spin.pack(side=LEFT, padx=10)
         ttk.Label(size_frame, text="MB").pack(side=LEFT)
         
-    def create_privacy_tab(self):
+    def create_privacy_tab(self, frame):
         """Create Privacy & Security tab"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="🔒 Privacy")
-        
-        # Data Sharing
-        self.create_section(frame, "Data & Privacy", [
-            ("data_sharing", "Anonymous Usage Statistics", "privacy", "checkbox"),
-            ("auto_log_clearing", "Auto-log Clearing", "privacy", "checkbox"),
-            ("block_telemetry", "Block Telemetry from Other Apps", "privacy", "checkbox"),
-        ])
+        self._build_sections("privacy", frame)
         
         # Log Retention
         log_frame = ttk.LabelFrame(frame, text="Log Retention", padding=10)
         log_frame.pack(fill=X, pady=10, padx=10)
         
-        self.log_retention_var = tk.IntVar(
-            value=self.settings_manager.get_setting("privacy", "log_retention_days", 30)
-        )
-        for days in [7, 30, 90]:
-            ttk.Radiobutton(log_frame, text=f"{days} days", 
-                           variable=self.log_retention_var, value=days).pack(anchor=W)
+        self.log_retention_var = self._var("privacy", "log_retention_days", 30, tk.IntVar)
+        self.create_choice(log_frame, self.log_retention_var,
+                           [(f"{days} days", days) for days in (7, 30, 90)]).pack(fill=X)
         
-    def create_appearance_tab(self):
+    def create_appearance_tab(self, frame):
         """Create Appearance & Interface tab with enhanced Color Palette features"""
-        frame = ttk.Frame(self.notebook)
-        frame.pack(fill='both', expand=True)
-        self.notebook.add(frame, text="🎨 Appearance")
+        from ui.theme_preview import ThemeSelectorWidget, ColorSwatchGrid
+        from ui.widgets import ScrollableFrame
         
         # Import color palette
         self.color_palette = get_color_palette()
+        appearance = self.settings_manager.get_many("appearance", {"color_theme": "Light", "custom_colors": {}})
         
         # Create scrollable frame for better layout
-        canvas = tk.Canvas(frame)
-        v_scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        h_scrollbar = ttk.Scrollbar(frame, orient="horizontal", command=canvas.xview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        v_scrollbar.pack(side="right", fill="y")
-        h_scrollbar.pack(side="bottom", fill="x")
-
-        # Mouse wheel scrolling (vertical)
-        def _on_mousewheel(event):
-            try:
-                if canvas.winfo_exists():
-                    canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            except Exception as e:
-                print(f"Error in mousewheel handler: {e}")
-        
-        # Mouse wheel scrolling (horizontal with Shift)
-        def _on_shift_mousewheel(event):
-            try:
-                if canvas.winfo_exists():
-                    canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-            except Exception as e:
-                print(f"Error in shift mousewheel handler: {e}")
-        
-        # Windows/Mac/Linux bindings
-        scrollable_frame.bind_all("<MouseWheel>", _on_mousewheel)
-        scrollable_frame.bind_all("<Shift-MouseWheel>", _on_shift_mousewheel)
-        scrollable_frame.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))  # Linux scroll up
-        scrollable_frame.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))   # Linux scroll down
+        scroll_frame = ScrollableFrame(frame)
+        scroll_frame.pack(fill=BOTH, expand=True)
+        scrollable_frame = scroll_frame.body
 
         # 1. Predefined Theme Selection
         theme_frame = ttk.LabelFrame(scrollable_frame, text="🎨 Predefined Themes", padding=15)
@@ -330,13 +431,13 @@ class SettingsPanel:
         # Theme selector with preview
         self.theme_selector = ThemeSelectorWidget(
             theme_frame, 
-            self.color_palette.get_all_themes(),
+            _all_themes(),
             on_theme_selected=self.on_theme_selected
         )
         self.theme_selector.pack(fill=BOTH, expand=True, pady=10)
         
         # Set current theme
-        current_theme = self.settings_manager.get_setting("appearance", "color_theme", "Light")
+        current_theme = appearance["color_theme"]
         self.theme_selector.set_selected_theme(current_theme)
         
         # 2. Custom Color Palette
@@ -344,16 +445,13 @@ class SettingsPanel:
         custom_frame.pack(fill=X, pady=10, padx=10)
         
         # Enable custom colors toggle
-        self.use_custom_colors_var = tk.BooleanVar(
-            value=self.settings_manager.get_setting("appearance", "use_custom_colors", False)
-        )
+        self.use_custom_colors_var = self._var("appearance", "use_custom_colors", False, tk.BooleanVar)
         ttk.Checkbutton(custom_frame, text="Enable Custom Colors", 
                        variable=self.use_custom_colors_var,
                        command=self.toggle_custom_colors).pack(anchor=W, pady=(0, 10))
         
-        # Custom color pickers
-        self.color_pickers = {}
-        custom_colors = self.settings_manager.get_setting("appearance", "custom_colors", {})
+        # Custom color swatches
+        custom_colors = appearance["custom_colors"]
         
         color_options = [
             ("primary_accent", "Primary Accent"),
@@ -365,16 +463,13 @@ class SettingsPanel:
             ("border", "Border")
         ]
         
-        for color_key, color_label in color_options:
-            initial_color = custom_colors.get(color_key, "#000000")
-            picker = ColorPickerWidget(
-                custom_frame, 
-                color_label, 
-                initial_color,
-                on_color_changed=self.on_custom_color_changed
-            )
-            picker.pack(fill=X, pady=2)
-            self.color_pickers[color_key] = picker
+        self.color_swatches = ColorSwatchGrid(
+            custom_frame,
+            [(color_key, color_label, custom_colors.get(color_key, "#000000"))
+             for color_key, color_label in color_options],
+            on_color_changed=self.on_custom_color_changed
+        )
+        self.color_swatches.pack(fill=X, pady=2)
         
         # Custom theme management
         custom_theme_frame = ttk.Frame(custom_frame)
@@ -398,6 +493,7 @@ class SettingsPanel:
         self.preview_area = ttk.Frame(preview_frame, relief="solid", borderwidth=2, height=200)
         self.preview_area.pack(fill=X, pady=10)
         self.preview_area.pack_propagate(False)
+        self._preview = None
         
         # Action buttons
         action_frame = ttk.Frame(preview_frame)
@@ -411,9 +507,7 @@ class SettingsPanel:
                   command=self.reset_theme).pack(side=LEFT, padx=5)
         
         # Sync with system theme
-        self.sync_system_var = tk.BooleanVar(
-            value=self.settings_manager.get_setting("appearance", "sync_with_system", False)
-        )
+        self.sync_system_var = self._var("appearance", "sync_with_system", False, tk.BooleanVar)
         ttk.Checkbutton(action_frame, text="🔄 Sync with System Theme", 
                        variable=self.sync_system_var).pack(side=RIGHT, padx=5)
         
@@ -423,42 +517,28 @@ class SettingsPanel:
         
         # ttkbootstrap theme selection
         ttk.Label(options_frame, text="ttkbootstrap Theme:").pack(anchor=W)
-        self.ttkbootstrap_theme_var = tk.StringVar(
-            value=self.settings_manager.get_setting("appearance", "ttkbootstrap_theme", "flatly")
-        )
-        ttkbootstrap_themes = ["flatly", "morph", "cyborg", "darkly", "solar", "superhero", "cosmo", "journal"]
+        self.ttkbootstrap_theme_var = self._var("appearance", "ttkbootstrap_theme", "flatly")
         ttkbootstrap_combo = ttk.Combobox(options_frame, textvariable=self.ttkbootstrap_theme_var, 
-                                         values=ttkbootstrap_themes, state="readonly")
+                                         values=TTKBOOTSTRAP_THEMES, state="readonly")
         ttkbootstrap_combo.pack(fill=X, pady=(0, 10))
         
-        # Other appearance options
-        self.create_section(options_frame, "Interface Options", [
-            ("high_contrast", "High Contrast Mode", "appearance", "checkbox"),
-            ("animations", "Enable Animations", "appearance", "checkbox"),
-        ])
+        self._build_sections("appearance", options_frame)
         
         # Font Size
         font_frame = ttk.LabelFrame(options_frame, text="Font Size", padding=10)
         font_frame.pack(fill=X, pady=10)
         
-        self.font_size_var = tk.StringVar(
-            value=self.settings_manager.get_setting("appearance", "font_size", "normal")
-        )
-        for size in ["small", "normal", "large"]:
-            ttk.Radiobutton(font_frame, text=size.title(), 
-                           variable=self.font_size_var, value=size).pack(anchor=W)
+        self.font_size_var = self._var("appearance", "font_size", "normal")
+        self.create_choice(font_frame, self.font_size_var,
+                           [(size.title(), size) for size in ("small", "normal", "large")]).pack(fill=X)
         
         # Language
         lang_frame = ttk.LabelFrame(options_frame, text="Language", padding=10)
         lang_frame.pack(fill=X, pady=10)
         
-        self.language_var = tk.StringVar(
-            value=self.settings_manager.get_setting("appearance", "language", "en")
-        )
+        self.language_var = self._var("appearance", "language", "en")
         languages = [("English", "en"), ("Spanish", "es"), ("French", "fr"), ("German", "de")]
-        for lang_name, lang_code in languages:
-            ttk.Radiobutton(lang_frame, text=lang_name, 
-                           variable=self.language_var, value=lang_code).pack(anchor=W)
+        self.create_choice(lang_frame, self.language_var, languages).pack(fill=X)
         
         # Initialize custom colors state
         self.toggle_custom_colors()
@@ -472,25 +552,40 @@ class SettingsPanel:
         self.update_preview()
     
     def on_custom_color_changed(self, color_name: str, color_value: str):
-        """Handle custom color change"""
-        custom_colors = self.settings_manager.get_setting("appearance", "custom_colors", {})
-        custom_colors[color_name.lower().replace(" ", "_")] = color_value
+        """Handle custom color change, batching writes that arrive in quick succession"""
+        self._color_dirty[color_name.lower().replace(" ", "_")] = color_value
+        if self._color_flush_id:
+            self.parent.after_cancel(self._color_flush_id)
+        self._color_flush_id = self.parent.after(150, self._flush_colors)
+    
+    def _flush_colors(self):
+        """Write all pending custom color changes in one settings update"""
+        self._color_flush_id = None
+        if not self._color_dirty:
+            return
+        # Copy so the manager sees a changed value rather than its own dict mutated in place
+        custom_colors = dict(self.settings_manager.get_setting("appearance", "custom_colors", {}))
+        custom_colors.update(self._color_dirty)
+        self._color_dirty.clear()
         self.settings_manager.set_setting("appearance", "custom_colors", custom_colors)
         self.update_preview()
     
     def toggle_custom_colors(self):
         """Toggle custom colors on/off"""
-        enabled = self.use_custom_colors_var.get()
-        for picker in self.color_pickers.values():
-            for widget in picker.winfo_children():
-                widget.configure(state="normal" if enabled else "disabled")
+        self.color_swatches.set_enabled(self.use_custom_colors_var.get())
         self.update_preview()
     
     def update_preview(self):
-        """Update the live preview"""
-        # Clear preview area
-        for widget in self.preview_area.winfo_children():
-            widget.destroy()
+        """Schedule a live preview update, coalescing rapid changes"""
+        if self._preview_job:
+            self.parent.after_cancel(self._preview_job)
+        self._preview_job = self.parent.after(50, self._render_preview)
+    
+    def _render_preview(self):
+        """Recolor the live preview for the current theme selection"""
+        self._preview_job = None
+        if self.preview_area is None:
+            return  # Appearance tab is not built
         
         # Get current theme data
         if self.use_custom_colors_var.get():
@@ -506,10 +601,13 @@ class SettingsPanel:
             theme_name = self.theme_selector.get_selected_theme()
             theme_data = self.color_palette.get_theme(theme_name) or {}
         
-        # Create preview widget
-        from ui.theme_preview import ThemePreviewWidget
-        preview = ThemePreviewWidget(self.preview_area, theme_data, size=200)
-        preview.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        # Create the preview once, then recolor it in place
+        if self._preview is None:
+            from ui.theme_preview import ThemePreviewWidget
+            self._preview = ThemePreviewWidget(self.preview_area, theme_data, size=200)
+            self._preview.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        else:
+            self._preview.apply_theme(theme_data)
     
     def apply_theme(self):
         """Apply the current theme"""
@@ -544,8 +642,8 @@ class SettingsPanel:
                 "border": "#D1D9E6"
             }
             
-            for color_key, picker in self.color_pickers.items():
-                picker.set_color(default_colors.get(color_key, "#000000"))
+            for color_key in self.color_swatches.get_colors():
+                self.color_swatches.set_color(color_key, default_colors.get(color_key, "#000000"))
             
             self.settings_manager.set_setting("appearance", "custom_colors", default_colors)
             self.update_preview()
@@ -559,21 +657,22 @@ class SettingsPanel:
             return
         
         # Get current colors
-        colors = {}
-        for color_key, picker in self.color_pickers.items():
-            colors[color_key] = picker.get_color()
+        colors = self.color_swatches.get_colors()
         
         # Create theme
         if self.color_palette.create_custom_theme(theme_name, colors, "Custom user theme"):
             messagebox.showinfo("Success", f"Custom theme '{theme_name}' saved!")
             # Refresh theme selector
-            self.theme_selector.themes = self.color_palette.get_all_themes()
+            _all_themes.cache_clear()
+            self.theme_selector.set_themes(_all_themes())
             self.theme_selector.set_selected_theme(theme_name)
         else:
             messagebox.showerror("Error", "Failed to save custom theme")
     
     def export_theme(self):
         """Export current theme"""
+        from tkinter import filedialog
+        
         theme_name = self.theme_selector.get_selected_theme()
         if not theme_name:
             messagebox.showwarning("Warning", "Please select a theme to export")
@@ -591,6 +690,8 @@ class SettingsPanel:
     
     def import_theme(self):
         """Import a theme from file"""
+        from tkinter import filedialog
+        
         filepath = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             title="Import Theme"
@@ -600,7 +701,8 @@ class SettingsPanel:
             if self.color_palette.import_theme(filepath):
                 messagebox.showinfo("Success", "Theme imported successfully!")
                 # Refresh theme selector
-                self.theme_selector.themes = self.color_palette.get_all_themes()
+                _all_themes.cache_clear()
+                self.theme_selector.set_themes(_all_themes())
             else:
                 messagebox.showerror("Error", "Failed to import theme")
     
@@ -631,8 +733,7 @@ class SettingsPanel:
     def create_exclusion_list(self, parent, excl_type, category):
         """Create exclusion list management"""
         # Load current exclusions
-        exclusions = self.settings_manager.get_setting(category, "exclusions", {})
-        current_list = exclusions.get(excl_type, [])
+        current_list = self._exclusion_items(category, excl_type)
         
         # Listbox with scrollbar
         list_frame = ttk.Frame(parent)
@@ -646,8 +747,8 @@ class SettingsPanel:
         scrollbar.pack(side=RIGHT, fill=Y)
         
         # Populate listbox
-        for item in current_list:
-            listbox.insert(tk.END, item)
+        if current_list:
+            listbox.insert(tk.END, *current_list)
         
         # Buttons
         btn_frame = ttk.Frame(parent)
@@ -673,31 +774,48 @@ class SettingsPanel:
         from tkinter import simpledialog
         
         item = simpledialog.askstring("Add Exclusion", f"Enter {excl_type} to exclude:")
-        if item:
+        if item and self.settings_manager.append_exclusion(category, excl_type, item):
             listbox.insert(tk.END, item)
-            self.save_exclusions(listbox, excl_type, category)
+            self.save_exclusions()
     
     def remove_exclusion(self, listbox, excl_type, category):
         """Remove selected exclusion"""
         selection = listbox.curselection()
         if selection:
-            listbox.delete(selection)
-            self.save_exclusions(listbox, excl_type, category)
+            item = listbox.get(selection[0])
+            listbox.delete(selection[0])
+            if self.settings_manager.remove_exclusion(category, excl_type, item):
+                self.save_exclusions()
     
     def clear_exclusions(self, listbox, excl_type, category):
         """Clear all exclusions"""
         if messagebox.askyesno("Clear Exclusions", f"Clear all {excl_type} exclusions?"):
             listbox.delete(0, tk.END)
-            self.save_exclusions(listbox, excl_type, category)
+            if self.settings_manager.clear_exclusions(category, excl_type):
+                self.save_exclusions()
+    
+    def _exclusion_items(self, category, excl_type):
+        """Get the stored exclusion list for a category and type"""
+        return self.settings_manager.get_setting(category, "exclusions", {}).get(excl_type, [])
     
-    def save_exclusions(self, listbox, excl_type, category):
-        """Save exclusions to settings"""
-        exclusions = self.settings_manager.get_setting(category, "exclusions", {})
-        exclusions[excl_type] = list(listbox.get(0, tk.END))
-        self.settings_manager.set_setting(category, "exclusions", exclusions)
+    def save_exclusions(self):
+        """Schedule writing the exclusion edits, coalescing rapid edits"""
+        if self._exclusions_flush_id:
+            self.parent.after_cancel(self._exclusions_flush_id)
+        self._exclusions_flush_id = self.parent.after(200, self._flush_exclusions)
+    
+    def _flush_exclusions(self):
+        """Write pending exclusion edits now"""
+        if not self._exclusions_flush_id:
+            return
+        self.parent.after_cancel(self._exclusions_flush_id)
+        self._exclusions_flush_id = None
+        self.settings_manager.save_settings()
     
     def browse_quarantine_folder(self):
         """Browse for quarantine folder"""
+        from tkinter import filedialog
+        
         folder = filedialog.askdirectory(title="Select Quarantine Folder")
         if folder:
             self.quarantine_folder_var.set(folder)
@@ -706,6 +824,23 @@ class SettingsPanel:
         """Check for updates"""
         messagebox.showinfo("Updates", "Checking for updates...\nThis feature will be implemented in future versions.")
     
+    def _var(self, category, key, default, vartype=tk.StringVar):
+        """Get the Tk variable for one setting, initialized from the settings snapshot
+
+        Variables are created once and reused whenever their tab is rebuilt.
+        """
+        var = self._vars.get((category, key))
+        if var is not None:
+            return var
+        var = vartype(value=self._settings.get(category, {}).get(key, default))
+        self._vars[(category, key)] = var
+        return var
+    
+    def _build_sections(self, name, parent):
+        """Create every settings section listed for a tab in _TAB_SPEC"""
+        for title, rows in self._TAB_SPEC[name]:
+            self.create_section(parent, title, rows)
+    
     def create_section(self, parent, title, settings_list):
         """Create a settings section with multiple controls"""
         section = ttk.LabelFrame(parent, text=title, padding=10)
@@ -716,22 +851,37 @@ class SettingsPanel:
             frame.pack(fill=X, pady=2)
             
             if control_type == "checkbox":
-                var = tk.BooleanVar(
-                    value=self.settings_manager.get_setting(category, setting_id, False)
-                )
+                var = self._var(category, setting_id, False, tk.BooleanVar)
                 cb = ttk.Checkbutton(frame, text=label, variable=var)
                 cb.pack(anchor=W)
                 setattr(self, f"{setting_id}_var", var)
                 
             elif control_type == "combobox":
-                var = tk.StringVar(
-                    value=self.settings_manager.get_setting(category, setting_id, args[0] if args else "")
-                )
+                var = self._var(category, setting_id, args[0] if args else "")
                 ttk.Label(frame, text=label).pack(side=LEFT)
                 combo = ttk.Combobox(frame, textvariable=var, values=args[0], state="readonly")
                 combo.pack(side=RIGHT, fill=X, expand=True, padx=(10, 0))
                 setattr(self, f"{setting_id}_var", var)
         
+    def create_choice(self, parent, variable, choices):
+        """Create a read-only combobox showing labels while storing values in variable"""
+        labels = [label for label, _ in choices]
+        values = [value for _, value in choices]
+        combo = ttk.Combobox(parent, values=labels, state="readonly")
+        
+        def _show(*args):
+            try:
+                if variable.get() in values:
+                    combo.current(values.index(variable.get()))
+            except tk.TclError:
+                pass  # Combobox already destroyed
+        
+        _show()
+        trace_id = variable.trace_add("write", _show)
+        combo.bind("<Destroy>", lambda e: variable.trace_remove("write", trace_id))
+        combo.bind("<<ComboboxSelected>>", lambda e: variable.set(values[combo.current()]))
+        return combo
+    
     def reset_protection_settings(self):
         """Reset protection settings to defaults"""
         self.real_time_protection_var.set(True)
@@ -747,193 +897,92 @@ class SettingsPanel:
         self.scan_compressed_files_var.set(True)
         self.scan_startup_programs_var.set(True)
         
-        # Clear exclusions
-        self.files_listbox.delete(0, tk.END)
-        self.folders_listbox.delete(0, tk.END)
-        self.extensions_listbox.delete(0, tk.END)
-        
+        # Clear exclusions with a single write
+        for excl_type in ("files", "folders", "extensions"):
+            listbox = getattr(self, f"{excl_type}_listbox")
+            if listbox is not None:
+                listbox.delete(0, tk.END)
+        self.settings_manager.set_setting("scanning", "exclusions",
+                                          {"files": [], "folders": [], "extensions": []})
+        
+    def save_mapped_settings(self, category=None):
+        """Save the variable-backed settings in _SAVE_MAP, optionally for one category"""
+        with self.settings_manager.batch():
+            for cat, key, attr in self._SAVE_MAP:
+                if category is not None and cat != category:
+                    continue
+                var = getattr(self, attr)
+                if var is not None:
+                    self.settings_manager.set_setting(cat, key, var.get())
+    
     def save_protection_settings(self):
         """Save protection settings"""
-        if hasattr(self, 'real_time_protection_var'):
-            self.settings_manager.set_setting("protection", "real_time_protection", 
-                                             self.real_time_protection_var.get())
-        if hasattr(self, 'firewall_protection_var'):
-            self.settings_manager.set_setting("protection", "firewall_protection", 
-                                             self.firewall_protection_var.get())
-        if hasattr(self, 'usb_protection_var'):
-            self.settings_manager.set_setting("protection", "usb_protection", 
-                                             self.usb_protection_var.get())
-        if hasattr(self, 'safe_browsing_var'):
-            self.settings_manager.set_setting("protection", "safe_browsing", 
-                                             self.safe_browsing_var.get())
-        if hasattr(self, 'webcam_microphone_control_var'):
-            self.settings_manager.set_setting("protection", "webcam_microphone_control", 
-                                             self.webcam_microphone_control_var.get())
-        if hasattr(self, 'heuristic_scanning_var'):
-            self.settings_manager.set_setting("protection", "heuristic_scanning", 
-                                             self.heuristic_scanning_var.get())
+        self.save_mapped_settings("protection")
     
     def save_scanning_settings(self):
         """Save scanning settings"""
-        if hasattr(self, 'default_scan_type_var'):
-            self.settings_manager.set_setting("scanning", "default_scan_type", 
-                                             self.default_scan_type_var.get())
-        if hasattr(self, 'scan_compressed_files_var'):
-            self.settings_manager.set_setting("scanning", "scan_compressed_files", 
-                                             self.scan_compressed_files_var.get())
-        if hasattr(self, 'scan_startup_programs_var'):
-            self.settings_manager.set_setting("scanning", "scan_startup_programs", 
-                                             self.scan_startup_programs_var.get())
-    
-    def save_appearance_settings(self):
-        """Save appearance settings including color palette features"""
-        # Original appearance settings
-        self.settings_manager.set_setting("appearance", "ttkbootstrap_theme", 
-                                         self.ttkbootstrap_theme_var.get())
-        self.settings_manager.set_setting("appearance", "font_size", 
-                                         self.font_size_var.get())
-        self.settings_manager.set_setting("appearance", "high_contrast", 
-                                         self.high_contrast_var.get())
-        self.settings_manager.set_setting("appearance", "animations", 
-                                         self.animations_var.get())
-        self.settings_manager.set_setting("appearance", "language", 
-                                         self.language_var.get())
-        
-        # Color palette settings
-        if hasattr(self, 'theme_selector'):
-            self.settings_manager.set_setting("appearance", "color_theme", 
-                                             self.theme_selector.get_selected_theme())
-        
-        if hasattr(self, 'use_custom_colors_var'):
-            self.settings_manager.set_setting("appearance", "use_custom_colors", 
-                                             self.use_custom_colors_var.get())
-        
-        if hasattr(self, 'sync_system_var'):
-            self.settings_manager.set_setting("appearance", "sync_with_system", 
-                                             self.sync_system_var.get())
-        
-        # Save custom colors
-        if hasattr(self, 'color_pickers'):
-            custom_colors = {}
-            for color_key, picker in self.color_pickers.items():
-                custom_colors[color_key] = picker.get_color()
-            self.settings_manager.set_setting("appearance", "custom_colors", custom_colors)
+        self.save_mapped_settings("scanning")
     
     def save_scheduling_settings(self):
         """Save scheduling settings"""
-        if hasattr(self, 'enable_scheduled_scans_var'):
-            self.settings_manager.set_setting("scheduling", "enable_scheduled_scans", 
-                                             self.enable_scheduled_scans_var.get())
-        if hasattr(self, 'scan_frequency_var'):
-            self.settings_manager.set_setting("scheduling", "scan_frequency", 
-                                             self.scan_frequency_var.get())
-        if hasattr(self, 'scan_time_var'):
-            self.settings_manager.set_setting("scheduling", "scan_time", 
-                                             self.scan_time_var.get())
-        if hasattr(self, 'auto_delete_threats_var'):
-            self.settings_manager.set_setting("scheduling", "auto_delete_threats", 
-                                             self.auto_delete_threats_var.get())
+        self.save_mapped_settings("scheduling")
     
     def save_notification_settings(self):
         """Save notification settings"""
-        if hasattr(self, 'threat_alerts_var'):
-            self.settings_manager.set_setting("notifications", "threat_alerts", 
-                                             self.threat_alerts_var.get())
-        if hasattr(self, 'scan_results_summary_var'):
-            self.settings_manager.set_setting("notifications", "scan_results_summary", 
-                                             self.scan_results_summary_var.get())
-        if hasattr(self, 'silent_mode_var'):
-            self.settings_manager.set_setting("notifications", "silent_mode", 
-                                             self.silent_mode_var.get())
-        if hasattr(self, 'notification_sound_var'):
-            self.settings_manager.set_setting("notifications", "notification_sound", 
-                                             self.notification_sound_var.get())
+        self.save_mapped_settings("notifications")
     
     def save_update_settings(self):
         """Save update settings"""
-        if hasattr(self, 'auto_update_definitions_var'):
-            self.settings_manager.set_setting("updates", "auto_update_definitions", 
-                                             self.auto_update_definitions_var.get())
-        if hasattr(self, 'auto_update_app_var'):
-            self.settings_manager.set_setting("updates", "auto_update_app", 
-                                             self.auto_update_app_var.get())
-        if hasattr(self, 'cloud_threat_detection_var'):
-            self.settings_manager.set_setting("updates", "cloud_threat_detection", 
-                                             self.cloud_threat_detection_var.get())
+        self.save_mapped_settings("updates")
     
     def save_performance_settings(self):
         """Save performance settings"""
-        if hasattr(self, 'cpu_limit_var'):
-            self.settings_manager.set_setting("performance", "cpu_usage_limit", 
-                                             self.cpu_limit_var.get())
-        if hasattr(self, 'ram_optimization_var'):
-            self.settings_manager.set_setting("performance", "ram_optimization", 
-                                             self.ram_optimization_var.get())
-        if hasattr(self, 'background_scan_var'):
-            self.settings_manager.set_setting("performance", "background_scan", 
-                                             self.background_scan_var.get())
-        if hasattr(self, 'idle_scan_mode_var'):
-            self.settings_manager.set_setting("performance", "idle_scan_mode", 
-                                             self.idle_scan_mode_var.get())
-        if hasattr(self, 'battery_saver_mode_var'):
-            self.settings_manager.set_setting("performance", "battery_saver_mode", 
-                                             self.battery_saver_mode_var.get())
+        self.save_mapped_settings("performance")
     
     def save_quarantine_settings(self):
         """Save quarantine settings"""
-        if hasattr(self, 'auto_delete_var'):
-            self.settings_manager.set_setting("quarantine", "auto_delete_after_days", 
-                                             self.auto_delete_var.get())
-        if hasattr(self, 'quarantine_folder_var'):
-            self.settings_manager.set_setting("quarantine", "quarantine_folder", 
-                                             self.quarantine_folder_var.get())
-        if hasattr(self, 'max_size_var'):
-            self.settings_manager.set_setting("quarantine", "max_quarantine_size_mb", 
-                                             self.max_size_var.get())
-        if hasattr(self, 'enable_file_submission_var'):
-            self.settings_manager.set_setting("quarantine", "enable_file_submission", 
-                                             self.enable_file_submission_var.get())
+        self.save_mapped_settings("quarantine")
     
     def save_privacy_settings(self):
         """Save privacy settings"""
-        if hasattr(self, 'data_sharing_var'):
-            self.settings_manager.set_setting("privacy", "data_sharing", 
-                                             self.data_sharing_var.get())
-        if hasattr(self, 'log_retention_var'):
-            self.settings_manager.set_setting("privacy", "log_retention_days", 
-                                             self.log_retention_var.get())
-        if hasattr(self, 'auto_log_clearing_var'):
-            self.settings_manager.set_setting("privacy", "auto_log_clearing", 
-                                             self.auto_log_clearing_var.get())
-        if hasattr(self, 'block_telemetry_var'):
-            self.settings_manager.set_setting("privacy", "block_telemetry", 
-                                             self.block_telemetry_var.get())
+        self.save_mapped_settings("privacy")
+    
+    def save_appearance_settings(self):
+        """Save appearance settings including color palette features"""
+        with self.settings_manager.batch():
+            self.save_mapped_settings("appearance")
+            self.save_palette_settings()
+    
+    def save_palette_settings(self):
+        """Save the color palette state held by the Appearance tab widgets"""
+        if self.theme_selector is not None:
+            self.settings_manager.set_setting("appearance", "color_theme", 
+                                             self.theme_selector.get_selected_theme())
+        
+        # Save custom colors
+        if self.color_swatches is not None:
+            self.settings_manager.set_setting("appearance", "custom_colors",
+                                             self.color_swatches.get_colors())
     
-    def save_all_settings(self):
-        """Save all settings from all categories"""
+    def save_all_settings(self, notify=True):
+        """Save all settings from all categories
+
+        With notify=False no message boxes are shown and errors are raised to the caller.
+        """
         try:
-            # Save all category settings
-            self.save_protection_settings()
-            self.save_scanning_settings()
-            self.save_scheduling_settings()
-            self.save_notification_settings()
-            self.save_update_settings()
-            self.save_performance_settings()
-            self.save_quarantine_settings()
-            self.save_privacy_settings()
-            self.save_appearance_settings()
-            
-            # Save exclusions if they exist
-            if hasattr(self, 'files_listbox'):
-                self.save_exclusions(self.files_listbox, "files", "scanning")
-            if hasattr(self, 'folders_listbox'):
-                self.save_exclusions(self.folders_listbox, "folders", "scanning")
-            if hasattr(self, 'extensions_listbox'):
-                self.save_exclusions(self.extensions_listbox, "extensions", "scanning")
+            # Everything below is written to disk once, when the batch ends
+            with self.settings_manager.batch():
+                # Save all category settings
+                self.save_mapped_settings()
+                self.save_palette_settings()
+                self._flush_exclusions()
             
-            messagebox.showinfo("Success", "All settings saved successfully!")
+            if notify:
+                messagebox.showinfo("Success", "All settings saved successfully!")
             
         except Exception as e:
+            if not notify:
+                raise
             messagebox.showerror("Error", f"Failed to save settings: {e}")
     
     def reset_settings(self):
@@ -948,7 +997,10 @@ class SettingsPanel:
     
     def export_settings(self):
         """Export all settings to file"""
+        from tkinter import filedialog
+        
         filepath = filedialog.asksaveasfilename(
+            parent=self.parent,
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             title="Export Settings"
@@ -956,8 +1008,8 @@ class SettingsPanel:
         
         if filepath:
             try:
-                # Save current settings first
-                self.save_all_settings()
+                # Save current settings first, without a second success popup
+                self.save_all_settings(notify=False)
                 
                 # Export settings
                 if self.settings_manager.export_settings(filepath):
@@ -969,7 +1021,10 @@ class SettingsPanel:
     
     def import_settings(self):
         """Import settings from file"""
+        from tkinter import filedialog
+        
         filepath = filedialog.askopenfilename(
+            parent=self.parent,
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             title="Import Settings"
         )
@@ -979,19 +1034,56 @@ class SettingsPanel:
                                   "This will replace all current settings.\nThis action cannot be undone.\n\nContinue?"):
                 try:
                     if self.settings_manager.import_settings(filepath):
+                        # Refresh the existing controls with the imported settings
+                        self._refresh_vars_from_settings()
                         messagebox.showinfo("Success", "Settings imported successfully!")
-                        # Refresh the UI with imported settings
-                        self.__init__(self.parent, self.main_window)
                     else:
                         messagebox.showerror("Error", "Failed to import settings")
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to import settings: {e}")
     
+    def _refresh_vars_from_settings(self):
+        """Update the existing variables and lists in place from the stored settings"""
+        # Drop edits that were waiting to be written; the stored settings now win
+        if self._color_flush_id:
+            self.parent.after_cancel(self._color_flush_id)
+            self._color_flush_id = None
+        self._color_dirty.clear()
+        if self._exclusions_flush_id:
+            self.parent.after_cancel(self._exclusions_flush_id)
+            self._exclusions_flush_id = None
+        
+        self._settings = copy.deepcopy(self.settings_manager.get_all_settings())
+        for category, key, attr in self._SAVE_MAP:
+            var = getattr(self, attr)
+            if var is not None and key in self._settings.get(category, {}):
+                var.set(self._settings[category][key])
+        if self.cpu_label is not None:
+            self.update_cpu_label(self.cpu_limit_var.get())
+        
+        # Exclusion lists
+        exclusions = self.settings_manager.get_setting("scanning", "exclusions", {})
+        for excl_type in ("files", "folders", "extensions"):
+            listbox = getattr(self, f"{excl_type}_listbox")
+            if listbox is not None:
+                listbox.delete(0, tk.END)
+                items = exclusions.get(excl_type)
+                if items:
+                    listbox.insert(tk.END, *items)
+        
+        # Color palette
+        appearance = self._settings.get("appearance", {})
+        if self.theme_selector is not None:
+            self.theme_selector.set_selected_theme(appearance.get("color_theme", "Light"))
+        if self.color_swatches is not None:
+            for color_key, color in appearance.get("custom_colors", {}).items():
+                if color_key in self.color_swatches.get_colors():
+                    self.color_swatches.set_color(color_key, color)
+            self.toggle_custom_colors()
+    
     def reset_all_data(self):
         """Reset all IronWall data to factory defaults"""
         try:
-            from utils.data_reset import DataResetManager
-            
             # Show confirmation dialog
             if not messagebox.askyesno("Reset All Data", 
                                       "⚠️  WARNING: This will reset ALL IronWall data to factory defaults!\n\n"
@@ -1007,9 +1099,6 @@ class SettingsPanel:
                                       "Continue?"):
                 return
             
-            # Create data reset manager
-            data_reset_manager = DataResetManager()
-            
             # Show progress dialog
             progress_window = tk.Toplevel(self.parent)
             progress_window.title("Resetting Data...")
@@ -1034,74 +1123,25 @@ class SettingsPanel:
             progress_bar.pack(fill='x', padx=20, pady=10)
             progress_bar.start()
             
-            # Perform reset in background thread
+            # Perform reset in background thread; widgets are only touched via after()
             def perform_reset():
                 try:
-                    status_label.config(text="Creating backup...")
-                    progress_window.update()
+                    # Loaded here so the Tk thread never waits on the import
+                    from utils.data_reset import DataResetManager
+                    data_reset_manager = DataResetManager()
+                    
+                    self.parent.after(0, lambda: status_label.config(text="Creating backup..."))
                     
                     # Perform the reset
                     results = data_reset_manager.reset_all_data(create_backup=True)
-                    
-                    # Show results
-                    success_count = sum(1 for success in results.values() if success)
-                    total_count = len(results)
-                    
-                    progress_window.destroy()
-                    
-                    if success_count == total_count:
-                        # Show verification of reset
-                        verification_text = f"✅ All data has been reset successfully!\n\n"
-                        verification_text += f"Operations completed: {success_count}/{total_count}\n\n"
-                        verification_text += "Data that was reset:\n"
-                        verification_text += "• Settings restored to factory defaults\n"
-                        verification_text += "• Scan history cleared\n"
-                        verification_text += "• Quarantine emptied\n"
-                        verification_text += "• Threat database cleared\n"
-                        verification_text += "• System logs cleared\n"
-                        verification_text += "• Scheduled scans removed\n"
-                        verification_text += "• Backup data cleared\n\n"
-                        verification_text += "A backup was created before the reset."
-                        
-                        messagebox.showinfo("Reset Complete", verification_text)
-                    else:
-                        messagebox.showwarning("Reset Partially Complete", 
-                                             f"⚠️  Reset completed with some issues.\n\n"
-                                             f"Successful operations: {success_count}/{total_count}")
-                        
-                        # Show detailed results
-                        result_text = "Reset Results:\n\n"
-                        for operation, success in results.items():
-                            status = "✅" if success else "❌"
-                            result_text += f"{status} {operation.replace('_', ' ').title()}\n"
-                        
-                        messagebox.showinfo("Detailed Results", result_text)
-                    
-                    # Refresh the settings panel
-                    try:
-                        # Clear the current settings panel
-                        for widget in self.main_frame.winfo_children():
-                            widget.destroy()
-                        
-                        # Recreate the settings panel
-                        self.create_settings_window()
-                        
-                        # Show success message
-                        messagebox.showinfo("Settings Refreshed", 
-                                          "Settings panel has been refreshed with default values.")
-                    except Exception as refresh_error:
-                        print(f"Error refreshing settings panel: {refresh_error}")
-                        messagebox.showinfo("Settings Refreshed", 
-                                          "Data reset completed. Please restart the application to see all changes.")
-                    
                 except Exception as e:
-                    progress_window.destroy()
-                    messagebox.showerror("Reset Error", f"Failed to reset data:\n{e}")
                     import traceback
                     traceback.print_exc()
+                    self.parent.after(0, self._on_reset_failed, progress_window, e)
+                    return
+                self.parent.after(0, self._on_reset_finished, progress_window, results)
             
             # Start reset thread
-            import threading
             reset_thread = threading.Thread(target=perform_reset)
             reset_thread.daemon = True
             reset_thread.start()
@@ -1109,4 +1149,58 @@ class SettingsPanel:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to initialize data reset: {e}")
             import traceback
-            traceback.print_exc() 
\ No newline at end of file
+            traceback.print_exc()
+    
+    def _on_reset_failed(self, progress_window, error):
+        """Report a failed data reset (runs on the Tk thread)"""
+        progress_window.destroy()
+        messagebox.showerror("Reset Error", f"Failed to reset data:\n{error}")
+    
+    def _on_reset_finished(self, progress_window, results):
+        """Report data reset results and refresh the panel (runs on the Tk thread)"""
+        # Show results
+        success_count = sum(1 for success in results.values() if success)
+        total_count = len(results)
+        
+        progress_window.destroy()
+        
+        if success_count == total_count:
+            # Show verification of reset
+            verification_text = f"✅ All data has been reset successfully!\n\n"
+            verification_text += f"Operations completed: {success_count}/{total_count}\n\n"
+            verification_text += "Data that was reset:\n"
+            verification_text += "• Settings restored to factory defaults\n"
+            verification_text += "• Scan history cleared\n"
+            verification_text += "• Quarantine emptied\n"
+            verification_text += "• Threat database cleared\n"
+            verification_text += "• System logs cleared\n"
+            verification_text += "• Scheduled scans removed\n"
+            verification_text += "• Backup data cleared\n\n"
+            verification_text += "A backup was created before the reset."
+            
+            messagebox.showinfo("Reset Complete", verification_text)
+        else:
+            messagebox.showwarning("Reset Partially Complete", 
+                                 f"⚠️  Reset completed with some issues.\n\n"
+                                 f"Successful operations: {success_count}/{total_count}")
+            
+            # Show detailed results
+            result_text = "Reset Results:\n\n"
+            for operation, success in results.items():
+                status = "✅" if success else "❌"
+                result_text += f"{status} {operation.replace('_', ' ').title()}\n"
+            
+            messagebox.showinfo("Detailed Results", result_text)
+        
+        # The reset wrote the defaults through its own manager; reload them and refresh in place
+        try:
+            self.settings_manager.load_settings()
+            self._refresh_vars_from_settings()
+            
+            # Show success message
+            messagebox.showinfo("Settings Refreshed", 
+                              "Settings panel has been refreshed with default values.")
+        except Exception as refresh_error:
+            print(f"Error refreshing settings panel: {refresh_error}")
+            messagebox.showinfo("Settings Refreshed", 
+                              "Data reset completed. Please restart the application to see all changes.")
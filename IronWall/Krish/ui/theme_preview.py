@@ -6,93 +6,115 @@ Shows live preview of color themes
 import tkinter as tk
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
+from utils.color_palette import ask_color
+
+# Colors used by the preview when a theme leaves one out
+_DEFAULT_THEME = {
+    "primary_accent": "#1976D2",
+    "secondary_accent": "#42A5F5",
+    "background": "#F7F9FB",
+    "surface": "#FFFFFF",
+    "text_primary": "#222B45",
+    "text_secondary": "#6B778C",
+    "border": "#D1D9E6",
+    "success": "#43A047",
+    "warning": "#FFA000",
+    "danger": "#D32F2F",
+    "info": "#1976D2"
+}
 
 class ThemePreviewWidget(ttk.Frame):
     """Widget for previewing color themes"""
     
+    # Status colors drawn as dots, and the (text, color key, font style) labels beneath them
+    STATUS_KEYS = ("success", "warning", "danger", "info")
+    STATUS_LABELS = (("Info", "info", "italic"),
+                     ("Success", "success", "bold"),
+                     ("Warning", "warning", "bold"),
+                     ("Danger", "danger", "bold"))
+    
     def __init__(self, parent, theme_data: Dict[str, str], size: int = 120, **kwargs):
         super().__init__(parent, **kwargs)
         self.theme_data = theme_data
         self.size = size
+        self._targets = []
         self.create_preview()
+        self.apply_theme(theme_data)
+    
+    def _track(self, item: int, option: str, color_key: str) -> int:
+        """Remember a canvas item option that follows one of the theme colors"""
+        self._targets.append((item, option, color_key))
+        return item
     
     def create_preview(self):
-        """Create the theme preview"""
-        # Main preview frame - use tk.Frame for background colors
-        border_color = self.theme_data.get("border", "#D1D9E6")
-        preview_frame = tk.Frame(self, relief="solid", borderwidth=2, bg=border_color)
-        preview_frame.pack(fill=BOTH, expand=True, padx=5, pady=5)
+        """Draw the theme preview layout once; apply_theme only recolors it"""
+        width, height = int(self.size * 1.4), self.size
         
-        # Header bar (simulating app header)
-        header_bg = self.theme_data.get("primary_accent", "#1976D2")
-        header_frame = tk.Frame(preview_frame, bg=header_bg, height=20)
-        header_frame.pack(fill=X, pady=(2, 0))
-        header_frame.pack_propagate(False)
+        # The preview never changes size, so fix the frame to it and skip geometry propagation
+        self.configure(width=width + 10, height=height + 10)
+        self.pack_propagate(False)
         
-        # Header title
-        header_text_color = self.theme_data.get("text_primary", "#FFFFFF")
-        header_label = tk.Label(header_frame, text="IronWall", 
-                               bg=header_bg, fg=header_text_color,
-                               font=("Segoe UI", 8, "bold"))
-        header_label.pack(side=LEFT, padx=5, pady=2)
+        self.canvas = tk.Canvas(self, width=width, height=height,
+                                highlightthickness=0, borderwidth=0)
+        self.canvas.pack(padx=5, pady=5)
+        canvas = self.canvas
         
-        # Sidebar (simulating app sidebar)
-        sidebar_bg = self.theme_data.get("surface", "#FFFFFF")
-        sidebar_frame = tk.Frame(preview_frame, bg=sidebar_bg, width=30)
-        sidebar_frame.pack(side=LEFT, fill=Y, pady=2)
-        sidebar_frame.pack_propagate(False)
+        # Border (simulating the app window frame)
+        self._track(canvas.create_rectangle(0, 0, width, height, outline=""),
+                    "fill", "border")
         
-        # Sidebar buttons
+        # Header bar (simulating app header)
+        self._track(canvas.create_rectangle(2, 2, width - 2, 22, outline=""),
+                    "fill", "primary_accent")
+        self._track(canvas.create_text(7, 12, text="IronWall", anchor=W,
+                                       font=("Segoe UI", 8, "bold")),
+                    "fill", "text_primary")
+        
+        # Sidebar (simulating app sidebar) with its buttons
+        self._track(canvas.create_rectangle(2, 24, 32, height - 2, outline=""),
+                    "fill", "surface")
         for i in range(3):
-            btn_bg = self.theme_data.get("secondary_accent", "#42A5F5")
-            btn = tk.Frame(sidebar_frame, bg=btn_bg, width=20, height=15)
-            btn.pack(pady=2, padx=5)
+            y = 28 + i * 19
+            self._track(canvas.create_rectangle(7, y, 27, y + 15, outline=""),
+                        "fill", "secondary_accent")
         
         # Main content area
-        content_bg = self.theme_data.get("background", "#F7F9FB")
-        content_frame = tk.Frame(preview_frame, bg=content_bg)
-        content_frame.pack(side=LEFT, fill=BOTH, expand=True, pady=2, padx=2)
-        
-        # Content elements
-        text_color = self.theme_data.get("text_primary", "#222B45")
-        secondary_color = self.theme_data.get("text_secondary", "#6B778C")
+        self._track(canvas.create_rectangle(34, 24, width - 2, height - 2, outline=""),
+                    "fill", "background")
+        x = 39
         
         # Title
-        title_label = tk.Label(content_frame, text="Dashboard", 
-                              bg=content_bg, fg=text_color,
-                              font=("Segoe UI", 7, "bold"))
-        title_label.pack(anchor=W, padx=5, pady=2)
-        
-        # Status indicators
-        status_frame = tk.Frame(content_frame, bg=content_bg)
-        status_frame.pack(fill=X, padx=5, pady=2)
+        self._track(canvas.create_text(x, 33, text="Dashboard", anchor=W,
+                                       font=("Segoe UI", 7, "bold")),
+                    "fill", "text_primary")
         
         # Status dots
-        success_color = self.theme_data.get("success", "#43A047")
-        warning_color = self.theme_data.get("warning", "#FFA000")
-        danger_color = self.theme_data.get("danger", "#D32F2F")
-        info_color = self.theme_data.get("info", "#1976D2")
-        
-        for color in [success_color, warning_color, danger_color, info_color]:
-            dot = tk.Frame(status_frame, bg=color, width=8, height=8)
-            dot.pack(side=LEFT, padx=1)
+        for i, color_key in enumerate(self.STATUS_KEYS):
+            dot_x = x + i * 10
+            self._track(canvas.create_rectangle(dot_x, 41, dot_x + 8, 49, outline=""),
+                        "fill", color_key)
         
         # Sample text
-        sample_text = tk.Label(content_frame, text="Sample content", 
-                              bg=content_bg, fg=secondary_color,
-                              font=("Segoe UI", 6))
-        sample_text.pack(anchor=W, padx=5, pady=1)
+        self._track(canvas.create_text(x, 57, text="Sample content", anchor=W,
+                                       font=("Segoe UI", 6)),
+                    "fill", "text_secondary")
         
         # Info/Success/Warning/Danger labels
-        info_label = tk.Label(content_frame, text="Info", bg=content_bg, fg=info_color, font=("Segoe UI", 6, "italic"))
-        info_label.pack(anchor=W, padx=5, pady=1)
-        success_label = tk.Label(content_frame, text="Success", bg=content_bg, fg=success_color, font=("Segoe UI", 6, "bold"))
-        success_label.pack(anchor=W, padx=5, pady=1)
-        warning_label = tk.Label(content_frame, text="Warning", bg=content_bg, fg=warning_color, font=("Segoe UI", 6, "bold"))
-        warning_label.pack(anchor=W, padx=5, pady=1)
-        danger_label = tk.Label(content_frame, text="Danger", bg=content_bg, fg=danger_color, font=("Segoe UI", 6, "bold"))
-        danger_label.pack(anchor=W, padx=5, pady=1)
+        for i, (text, color_key, style) in enumerate(self.STATUS_LABELS):
+            self._track(canvas.create_text(x, 69 + i * 11, text=text, anchor=W,
+                                           font=("Segoe UI", 6, style)),
+                        "fill", color_key)
+    
+    def apply_theme(self, theme_data: Dict[str, str]):
+        """Recolor the existing preview items for a theme"""
+        self.theme_data = theme_data
+        colors = {**_DEFAULT_THEME, **theme_data}
+        for item, option, color_key in self._targets:
+            try:
+                self.canvas.itemconfigure(item, {option: colors[color_key]})
+            except tk.TclError:
+                self.canvas.itemconfigure(item, {option: _DEFAULT_THEME[color_key]})  # Invalid color format
 
 class ThemeSelectorWidget(ttk.Frame):
     """Widget for selecting themes with preview"""
@@ -103,6 +125,9 @@ class ThemeSelectorWidget(ttk.Frame):
         self.themes = themes
         self.on_theme_selected = on_theme_selected
         self.selected_theme = tk.StringVar()
+        self._pending_after = None
+        self._preview_idle = None
+        self._preview_theme = None
         self.create_widget()
     
     def create_widget(self):
@@ -130,8 +155,7 @@ class ThemeSelectorWidget(ttk.Frame):
         scrollbar.pack(side=RIGHT, fill=Y)
         
         # Populate themes
-        for theme_name in self.themes.keys():
-            self.theme_listbox.insert(tk.END, theme_name)
+        self._populate_themes()
         
         # Bind selection event
         self.theme_listbox.bind('<<ListboxSelect>>', self.on_theme_change)
@@ -154,24 +178,59 @@ class ThemeSelectorWidget(ttk.Frame):
         self.preview_widget = None
         
         # Select first theme by default
-        if self.themes:
-            first_theme = list(self.themes.keys())[0]
+        first_theme = next(iter(self._theme_names), None)
+        if first_theme is not None:
             self.theme_listbox.selection_set(0)
             self.update_preview(first_theme)
     
+    def _populate_themes(self):
+        """Fill the listbox and the name lookup from self.themes"""
+        self._theme_names = tuple(self.themes)
+        self._name_to_index = {name: i for i, name in enumerate(self._theme_names)}
+        self.theme_listbox.delete(0, tk.END)
+        if self._theme_names:
+            self.theme_listbox.insert(tk.END, *self._theme_names)
+    
+    def set_themes(self, themes: Dict[str, Dict[str, str]]):
+        """Replace the available themes, keeping the current selection if it still exists"""
+        self.themes = themes
+        self._populate_themes()
+        selected = self.get_selected_theme()
+        if selected in self._name_to_index:
+            self.set_selected_theme(selected)
+    
     def on_theme_change(self, event):
-        """Handle theme selection change"""
+        """Handle theme selection change, coalescing rapid selections"""
         selection = self.theme_listbox.curselection()
         if selection:
             theme_name = self.theme_listbox.get(selection[0])
             self.selected_theme.set(theme_name)
-            self.update_preview(theme_name)
             
-            if self.on_theme_selected:
-                self.on_theme_selected(theme_name)
+            # Arrow-keying through the list only updates the preview once it settles
+            if self._pending_after:
+                self.after_cancel(self._pending_after)
+            self._pending_after = self.after(80, self._do_update, theme_name)
+    
+    def _do_update(self, theme_name: str):
+        """Update the preview and notify the listener for a settled selection"""
+        self._pending_after = None
+        self.update_preview(theme_name)
+        
+        if self.on_theme_selected:
+            self.on_theme_selected(theme_name)
     
     def update_preview(self, theme_name: str):
-        """Update the preview for the selected theme"""
+        """Schedule a preview update for the selected theme"""
+        # Idle callbacks run once pending events are handled, so the listbox
+        # selection highlight paints before the preview is recolored
+        self._preview_theme = theme_name
+        if self._preview_idle is None:
+            self._preview_idle = self.after_idle(self._render_preview)
+    
+    def _render_preview(self):
+        """Show the most recently requested theme in the preview"""
+        self._preview_idle = None
+        theme_name = self._preview_theme
         theme_data = self.themes.get(theme_name, {})
         
         # Update title and description
@@ -180,10 +239,18 @@ class ThemeSelectorWidget(ttk.Frame):
         
         # Update preview widget
         if self.preview_widget:
-            self.preview_widget.destroy()
-        
-        self.preview_widget = ThemePreviewWidget(self, theme_data, size=150)
-        self.preview_widget.pack(fill=BOTH, expand=True)
+            self.preview_widget.apply_theme(theme_data)
+        else:
+            self.preview_widget = ThemePreviewWidget(self, theme_data, size=150)
+            self.preview_widget.pack(fill=BOTH, expand=True)
+    
+    def destroy(self):
+        """Cancel pending preview updates before destroying the widget"""
+        for job in (self._pending_after, self._preview_idle):
+            if job:
+                self.after_cancel(job)
+        self._pending_after = self._preview_idle = None
+        super().destroy()
     
     def get_selected_theme(self) -> str:
         """Get the currently selected theme name"""
@@ -191,13 +258,13 @@ class ThemeSelectorWidget(ttk.Frame):
     
     def set_selected_theme(self, theme_name: str):
         """Set the selected theme"""
-        for i, name in enumerate(self.themes.keys()):
-            if name == theme_name:
-                self.theme_listbox.selection_clear(0, tk.END)
-                self.theme_listbox.selection_set(i)
-                self.theme_listbox.see(i)
-                self.update_preview(theme_name)
-                break
+        i = self._name_to_index.get(theme_name)
+        if i is None:
+            return
+        self.theme_listbox.selection_clear(0, tk.END)
+        self.theme_listbox.selection_set(i)
+        self.theme_listbox.see(i)
+        self.update_preview(theme_name)
 
 class ColorPickerWidget(ttk.Frame):
     """Widget for picking custom colors"""
@@ -209,6 +276,7 @@ class ColorPickerWidget(ttk.Frame):
         self.initial_color = initial_color
         self.on_color_changed = on_color_changed
         self.current_color = tk.StringVar(value=initial_color)
+        self._committed_color = initial_color
         self.create_widget()
     
     def create_widget(self):
@@ -221,34 +289,41 @@ class ColorPickerWidget(ttk.Frame):
                                   bg=self.current_color.get(),
                                   command=self.pick_color)
         self.color_btn.pack(side=LEFT, padx=5)
+        self._last_applied = self.current_color.get()
         
         # Color entry
         self.color_entry = ttk.Entry(self, textvariable=self.current_color, width=10)
         self.color_entry.pack(side=LEFT, padx=5)
         
-        # Bind entry change
-        self.current_color.trace('w', self.on_entry_change)
+        # Apply typed colors once editing is finished rather than on every keystroke
+        self.color_entry.bind('<Return>', self.on_entry_change)
+        self.color_entry.bind('<FocusOut>', self.on_entry_change)
     
     def pick_color(self):
         """Open color picker dialog"""
-        from tkinter import colorchooser
-        color = colorchooser.askcolor(self.current_color.get(), 
-                                     title=f"Choose {self.color_name}")
-        if color[1]:  # color[1] contains the hex color
-            self.current_color.set(color[1])
-            self.update_color_preview()
+        color = ask_color(self.current_color.get(), f"Choose {self.color_name}", self)
+        if color:
+            self.current_color.set(color)
+            self.on_entry_change()
     
     def on_entry_change(self, *args):
-        """Handle color entry change"""
+        """Apply the entered color if it changed since it was last committed"""
+        if self.current_color.get() == self._committed_color:
+            return
+        self._committed_color = self.current_color.get()
         self.update_color_preview()
         if self.on_color_changed:
             self.on_color_changed(self.color_name, self.current_color.get())
     
     def update_color_preview(self):
         """Update the color preview button"""
+        color = self.current_color.get()
+        if color == self._last_applied:
+            return
         try:
-            self.color_btn.configure(bg=self.current_color.get())
-        except:
+            self.color_btn.configure(bg=color)
+            self._last_applied = color
+        except tk.TclError:
             pass  # Invalid color format
     
     def get_color(self) -> str:
@@ -258,4 +333,77 @@ class ColorPickerWidget(ttk.Frame):
     def set_color(self, color: str):
         """Set the color value"""
         self.current_color.set(color)
-        self.update_color_preview() 
\ No newline at end of file
+        self.on_entry_change()
+
+class ColorSwatchGrid(tk.Canvas):
+    """Canvas that draws one clickable color swatch per custom color"""
+    
+    SWATCH_SIZE = 24
+    ROW_HEIGHT = 30
+    
+    def __init__(self, parent, colors: List[Tuple[str, str, str]],
+                 on_color_changed: Optional[Callable] = None, **kwargs):
+        kwargs.setdefault("height", len(colors) * self.ROW_HEIGHT + 4)
+        kwargs.setdefault("highlightthickness", 0)
+        super().__init__(parent, **kwargs)
+        self.on_color_changed = on_color_changed
+        self.enabled = True
+        self._colors = {}
+        self._labels = {}
+        self.create_grid(colors)
+        self.bind("<Button-1>", self.on_click)
+    
+    def create_grid(self, colors: List[Tuple[str, str, str]]):
+        """Draw a swatch and caption for each (key, label, color) entry"""
+        size = self.SWATCH_SIZE
+        for row, (key, label, color) in enumerate(colors):
+            y = 2 + row * self.ROW_HEIGHT
+            self._colors[key] = color
+            self._labels[key] = label
+            self.create_rectangle(2, y, 2 + size, y + size, fill=color,
+                                  outline="#888888", disabledstipple="gray50",
+                                  tags=("swatch", key))
+            self.create_text(2 + size + 8, y + size // 2, text=f"{label}: {color}",
+                             anchor=W, font=("Segoe UI", 9), disabledfill="#888888",
+                             tags=("caption", key))
+    
+    def on_click(self, event):
+        """Open a color chooser for the swatch under the pointer"""
+        if not self.enabled:
+            return
+        # Only a swatch directly under the pointer counts; gaps and captions are ignored
+        swatches = [item for item in self.find_overlapping(event.x, event.y, event.x, event.y)
+                    if "swatch" in self.gettags(item)]
+        if not swatches:
+            return
+        key = next((tag for tag in self.gettags(swatches[-1]) if tag in self._colors), None)
+        if key is None:
+            return
+        
+        color = ask_color(self._colors[key], f"Choose {self._labels[key]}", self)
+        if color:
+            self.set_color(key, color)
+            if self.on_color_changed:
+                self.on_color_changed(key, color)
+    
+    def get_color(self, key: str) -> str:
+        """Get the current color for a key"""
+        return self._colors[key]
+    
+    def get_colors(self) -> Dict[str, str]:
+        """Get all current colors keyed by color name"""
+        return dict(self._colors)
+    
+    def set_color(self, key: str, color: str):
+        """Set the color for a key and redraw its swatch"""
+        try:
+            self.itemconfigure(f"swatch&&{key}", fill=color)
+        except tk.TclError:
+            return  # Invalid color format
+        self._colors[key] = color
+        self.itemconfigure(f"caption&&{key}", text=f"{self._labels[key]}: {color}")
+    
+    def set_enabled(self, enabled: bool):
+        """Enable or disable picking colors"""
+        self.enabled = enabled
+        self.itemconfigure("all", state=NORMAL if enabled else DISABLED)
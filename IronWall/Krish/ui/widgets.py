@@ -0,0 +1,80 @@
+"""
+IronWall Antivirus - Shared Widgets
+Reusable widgets shared by the UI panels
+"""
+
+import tkinter as tk
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+
+class ScrollableFrame(ttk.Frame):
+    """Frame whose body scrolls inside a canvas in both directions"""
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._pending = None
+
+        self.canvas = tk.Canvas(self, highlightthickness=0)
+        v_scrollbar = ttk.Scrollbar(self, orient=VERTICAL, command=self.canvas.yview)
+        h_scrollbar = ttk.Scrollbar(self, orient=HORIZONTAL, command=self.canvas.xview)
+        self.body = ttk.Frame(self.canvas)
+
+        self.canvas.create_window((0, 0), window=self.body, anchor=NW)
+        self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+
+        h_scrollbar.pack(side=BOTTOM, fill=X)
+        v_scrollbar.pack(side=RIGHT, fill=Y)
+        self.canvas.pack(side=LEFT, fill=BOTH, expand=True)
+
+        # Children resizing the body only update the scroll region once per idle period
+        self.body.bind("<Configure>", self._on_configure)
+
+        # Mouse wheel bindings are global, so only hold them while the pointer is over the canvas
+        self._wheel_bindings = {
+            "<MouseWheel>": self._on_mousewheel,
+            "<Shift-MouseWheel>": self._on_shift_mousewheel,
+            "<Button-4>": lambda e: self.canvas.yview_scroll(-1, "units"),  # Linux scroll up
+            "<Button-5>": lambda e: self.canvas.yview_scroll(1, "units"),   # Linux scroll down
+        }
+        self.canvas.bind("<Enter>", self._bind_wheel)
+        self.canvas.bind("<Leave>", self._unbind_wheel)
+
+    def _on_configure(self, event):
+        """Schedule a scroll region update"""
+        if self._pending:
+            return
+        self._pending = self.after_idle(self._update_region)
+
+    def _update_region(self):
+        """Fit the scroll region to the body"""
+        self._pending = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _on_mousewheel(self, event):
+        """Scroll vertically"""
+        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    def _on_shift_mousewheel(self, event):
+        """Scroll horizontally"""
+        self.canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    def _bind_wheel(self, event):
+        """Route mouse wheel events to this canvas"""
+        for sequence, handler in self._wheel_bindings.items():
+            self.canvas.bind_all(sequence, handler)
+
+    def _unbind_wheel(self, event):
+        """Release the mouse wheel once the pointer leaves the canvas"""
+        # Moving onto a child of the canvas also generates <Leave>
+        hovered = self.canvas.winfo_containing(event.x_root, event.y_root)
+        if hovered is not None and (hovered == self.canvas or str(hovered).startswith(f"{self.canvas}.")):
+            return
+        for sequence in self._wheel_bindings:
+            self.canvas.unbind_all(sequence)
+
+    def destroy(self):
+        """Cancel pending work before destroying the frame"""
+        if self._pending:
+            self.after_cancel(self._pending)
+            self._pending = None
+        super().destroy()
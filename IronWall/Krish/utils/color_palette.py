@@ -3,197 +3,267 @@ IronWall Antivirus - Color Palette Manager
 Manages predefined themes and custom color schemes
 """
 
+import atexit
+import functools
 import json
 import os
+import re
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
-from tkinter import colorchooser
+from typing import Dict, Any, List, Tuple, Optional, Mapping
+import types
 import tkinter as tk
 
+# Faster JSON parsing and encoding when orjson is installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw file bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as indented UTF-8 JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+_HEX_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+_RGBA_RE = re.compile(r'^rgba\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*,'
+                      r'\s*(\d+(?:\.\d+)?)\s*,\s*(\d*\.?\d+)\s*\)$')
+
+@functools.lru_cache(maxsize=256)
+def parse_hex(color: str) -> Tuple[int, int, int]:
+    """Parse a #RRGGBB color into an (r, g, b) tuple, caching repeated colors"""
+    if not _HEX_RE.fullmatch(color):
+        raise ValueError(f"Invalid hex color: {color!r}")
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+# Theme colors shown by get_theme_preview_colors, in order
+_PREVIEW_KEYS = ("primary_accent", "secondary_accent", "background", "surface", "text_primary")
+
+# Built-in themes; shared read-only by every ColorPalette
+_PREDEFINED_THEMES = types.MappingProxyType({
+    "Light": {
+        "name": "Light",
+        "description": "Clean, modern light theme",
+        "primary_accent": "#1976D2",
+        "secondary_accent": "#42A5F5",
+        "background": "#F7F9FB",
+        "surface": "#FFFFFF",
+        "text_primary": "#222B45",
+        "text_secondary": "#6B778C",
+        "border": "#D1D9E6",
+        "success": "#43A047",
+        "warning": "#FFA000",
+        "danger": "#D32F2F",
+        "info": "#1976D2"
+    },
+    "Dark": {
+        "name": "Dark",
+        "description": "Professional dark theme",
+        "primary_accent": "#00D4FF",
+        "secondary_accent": "#4FC3F7",
+        "background": "#0A0A0F",
+        "surface": "#1A1A2E",
+        "text_primary": "#E8E8E8",
+        "text_secondary": "#A0A0A0",
+        "border": "#2A2A3E",
+        "success": "#00FF88",
+        "warning": "#FFB800",
+        "danger": "#FF0055",
+        "info": "#00D4FF"
+    },
+    "IronWall": {
+        "name": "IronWall",
+        "description": "Glassmorphic IronWall theme",
+        "primary_accent": "#FF6B35",
+        "secondary_accent": "#F7931E",
+        "background": "#F7F9FB",
+        "surface": "#FFFFFF",
+        "text_primary": "#2C3E50",
+        "text_secondary": "#7F8C8D",
+        "border": "#D1D9E6",
+        "success": "#27AE60",
+        "warning": "#F39C12",
+        "danger": "#E74C3C",
+        "info": "#3498DB"
+    },
+    "Cyber": {
+        "name": "Cyber",
+        "description": "Futuristic cyberpunk theme",
+        "primary_accent": "#00FF41",
+        "secondary_accent": "#00D4FF",
+        "background": "#0A0A0F",
+        "surface": "#1A1A2E",
+        "text_primary": "#00FF41",
+        "text_secondary": "#00D4FF",
+        "border": "#00FF41",
+        "success": "#00FF41",
+        "warning": "#FFB800",
+        "danger": "#FF0055",
+        "info": "#00D4FF"
+    },
+    "Minimal Gray": {
+        "name": "Minimal Gray",
+        "description": "Minimalist grayscale theme",
+        "primary_accent": "#424242",
+        "secondary_accent": "#757575",
+        "background": "#FAFAFA",
+        "surface": "#FFFFFF",
+        "text_primary": "#212121",
+        "text_secondary": "#757575",
+        "border": "#E0E0E0",
+        "success": "#4CAF50",
+        "warning": "#FF9800",
+        "danger": "#F44336",
+        "info": "#2196F3"
+    },
+    "High Contrast": {
+        "name": "High Contrast",
+        "description": "Accessibility-focused high contrast theme",
+        "primary_accent": "#FFFFFF",
+        "secondary_accent": "#FFFF00",
+        "background": "#000000",
+        "surface": "#000000",
+        "text_primary": "#FFFFFF",
+        "text_secondary": "#FFFF00",
+        "border": "#FFFFFF",
+        "success": "#00FF00",
+        "warning": "#FFFF00",
+        "danger": "#FF0000",
+        "info": "#00FFFF"
+    },
+    "Ocean Blue": {
+        "name": "Ocean Blue",
+        "description": "Cool blue and teal ocean-inspired theme",
+        "primary_accent": "#0077B6",
+        "secondary_accent": "#00B4D8",
+        "background": "#CAF0F8",
+        "surface": "#90E0EF",
+        "text_primary": "#03045E",
+        "text_secondary": "#0077B6",
+        "border": "#00B4D8",
+        "success": "#43A047",
+        "warning": "#FFD166",
+        "danger": "#EF476F",
+        "info": "#118AB2"
+    },
+    "Solarized": {
+        "name": "Solarized",
+        "description": "Popular Solarized color scheme for coding",
+        "primary_accent": "#268BD2",
+        "secondary_accent": "#2AA198",
+        "background": "#FDF6E3",
+        "surface": "#EEE8D5",
+        "text_primary": "#657B83",
+        "text_secondary": "#93A1A1",
+        "border": "#839496",
+        "success": "#859900",
+        "warning": "#B58900",
+        "danger": "#DC322F",
+        "info": "#268BD2"
+    },
+    "Forest Green": {
+        "name": "Forest Green",
+        "description": "Nature-inspired theme with deep greens and earthy browns",
+        "primary_accent": "#388E3C",
+        "secondary_accent": "#8D6E63",
+        "background": "#E8F5E9",
+        "surface": "#C8E6C9",
+        "text_primary": "#1B5E20",
+        "text_secondary": "#4E342E",
+        "border": "#A5D6A7",
+        "success": "#43A047",
+        "warning": "#FBC02D",
+        "danger": "#D84315",
+        "info": "#388E3C"
+    },
+    "Purple Night": {
+        "name": "Purple Night",
+        "description": "Modern dark theme with purple and magenta highlights",
+        "primary_accent": "#8E24AA",
+        "secondary_accent": "#D500F9",
+        "background": "#1A0033",
+        "surface": "#311B92",
+        "text_primary": "#F3E5F5",
+        "text_secondary": "#B39DDB",
+        "border": "#7C43BD",
+        "success": "#00E676",
+        "warning": "#FFD600",
+        "danger": "#FF1744",
+        "info": "#651FFF"
+    },
+    "Sunset Orange": {
+        "name": "Sunset Orange",
+        "description": "Warm, energetic theme with orange and red hues",
+        "primary_accent": "#FF7043",
+        "secondary_accent": "#FFB300",
+        "background": "#FFF3E0",
+        "surface": "#FFE0B2",
+        "text_primary": "#BF360C",
+        "text_secondary": "#FF8A65",
+        "border": "#FFB74D",
+        "success": "#43A047",
+        "warning": "#FFA000",
+        "danger": "#D32F2F",
+        "info": "#FF7043"
+    }
+})
+
 class ColorPalette:
     """Manages color themes and palettes for IronWall Antivirus"""
     
+    SAVE_DELAY = 0.5  # Seconds to wait for further theme edits before writing
+    
     def __init__(self, themes_file: str = "themes.json"):
         self.themes_file = Path(themes_file)
+        self._save_lock = threading.RLock()  # Guards the custom themes against the save timer thread
+        self._dirty = False
+        self._save_timer = None
+        self._themes_version = 0
+        self._cache_version = -1
+        self._theme_names_cache = None
+        self._preview_cache = {}
         self.predefined_themes = self._load_predefined_themes()
-        self.custom_themes = self._load_custom_themes()
+        self._predefined_names = frozenset(self.predefined_themes)
+        self._custom_themes = None  # Read from file on first use
+        self._theme_map = None  # Predefined and custom themes in one dict, built on first use
+        atexit.register(self.flush)
         
-    def _load_predefined_themes(self) -> Dict[str, Dict[str, str]]:
+    def _load_predefined_themes(self) -> Mapping[str, Dict[str, str]]:
         """Load predefined color themes"""
-        return {
-            "Light": {
-                "name": "Light",
-                "description": "Clean, modern light theme",
-                "primary_accent": "#1976D2",
-                "secondary_accent": "#42A5F5",
-                "background": "#F7F9FB",
-                "surface": "#FFFFFF",
-                "text_primary": "#222B45",
-                "text_secondary": "#6B778C",
-                "border": "#D1D9E6",
-                "success": "#43A047",
-                "warning": "#FFA000",
-                "danger": "#D32F2F",
-                "info": "#1976D2"
-            },
-            "Dark": {
-                "name": "Dark",
-                "description": "Professional dark theme",
-                "primary_accent": "#00D4FF",
-                "secondary_accent": "#4FC3F7",
-                "background": "#0A0A0F",
-                "surface": "#1A1A2E",
-                "text_primary": "#E8E8E8",
-                "text_secondary": "#A0A0A0",
-                "border": "#2A2A3E",
-                "success": "#00FF88",
-                "warning": "#FFB800",
-                "danger": "#FF0055",
-                "info": "#00D4FF"
-            },
-            "IronWall": {
-                "name": "IronWall",
-                "description": "Glassmorphic IronWall theme",
-                "primary_accent": "#FF6B35",
-                "secondary_accent": "#F7931E",
-                "background": "#F7F9FB",
-                "surface": "#FFFFFF",
-                "text_primary": "#2C3E50",
-                "text_secondary": "#7F8C8D",
-                "border": "#D1D9E6",
-                "success": "#27AE60",
-                "warning": "#F39C12",
-                "danger": "#E74C3C",
-                "info": "#3498DB"
-            },
-            "Cyber": {
-                "name": "Cyber",
-                "description": "Futuristic cyberpunk theme",
-                "primary_accent": "#00FF41",
-                "secondary_accent": "#00D4FF",
-                "background": "#0A0A0F",
-                "surface": "#1A1A2E",
-                "text_primary": "#00FF41",
-                "text_secondary": "#00D4FF",
-                "border": "#00FF41",
-                "success": "#00FF41",
-                "warning": "#FFB800",
-                "danger": "#FF0055",
-                "info": "#00D4FF"
-            },
-            "Minimal Gray": {
-                "name": "Minimal Gray",
-                "description": "Minimalist grayscale theme",
-                "primary_accent": "#424242",
-                "secondary_accent": "#757575",
-                "background": "#FAFAFA",
-                "surface": "#FFFFFF",
-                "text_primary": "#212121",
-                "text_secondary": "#757575",
-                "border": "#E0E0E0",
-                "success": "#4CAF50",
-                "warning": "#FF9800",
-                "danger": "#F44336",
-                "info": "#2196F3"
-            },
-            "High Contrast": {
-                "name": "High Contrast",
-                "description": "Accessibility-focused high contrast theme",
-                "primary_accent": "#FFFFFF",
-                "secondary_accent": "#FFFF00",
-                "background": "#000000",
-                "surface": "#000000",
-                "text_primary": "#FFFFFF",
-                "text_secondary": "#FFFF00",
-                "border": "#FFFFFF",
-                "success": "#00FF00",
-                "warning": "#FFFF00",
-                "danger": "#FF0000",
-                "info": "#00FFFF"
-            },
-            "Ocean Blue": {
-                "name": "Ocean Blue",
-                "description": "Cool blue and teal ocean-inspired theme",
-                "primary_accent": "#0077B6",
-                "secondary_accent": "#00B4D8",
-                "background": "#CAF0F8",
-                "surface": "#90E0EF",
-                "text_primary": "#03045E",
-                "text_secondary": "#0077B6",
-                "border": "#00B4D8",
-                "success": "#43A047",
-                "warning": "#FFD166",
-                "danger": "#EF476F",
-                "info": "#118AB2"
-            },
-            "Solarized": {
-                "name": "Solarized",
-                "description": "Popular Solarized color scheme for coding",
-                "primary_accent": "#268BD2",
-                "secondary_accent": "#2AA198",
-                "background": "#FDF6E3",
-                "surface": "#EEE8D5",
-                "text_primary": "#657B83",
-                "text_secondary": "#93A1A1",
-                "border": "#839496",
-                "success": "#859900",
-                "warning": "#B58900",
-                "danger": "#DC322F",
-                "info": "#268BD2"
-            },
-            "Forest Green": {
-                "name": "Forest Green",
-                "description": "Nature-inspired theme with deep greens and earthy browns",
-                "primary_accent": "#388E3C",
-                "secondary_accent": "#8D6E63",
-                "background": "#E8F5E9",
-                "surface": "#C8E6C9",
-                "text_primary": "#1B5E20",
-                "text_secondary": "#4E342E",
-                "border": "#A5D6A7",
-                "success": "#43A047",
-                "warning": "#FBC02D",
-                "danger": "#D84315",
-                "info": "#388E3C"
-            },
-            "Purple Night": {
-                "name": "Purple Night",
-                "description": "Modern dark theme with purple and magenta highlights",
-                "primary_accent": "#8E24AA",
-                "secondary_accent": "#D500F9",
-                "background": "#1A0033",
-                "surface": "#311B92",
-                "text_primary": "#F3E5F5",
-                "text_secondary": "#B39DDB",
-                "border": "#7C43BD",
-                "success": "#00E676",
-                "warning": "#FFD600",
-                "danger": "#FF1744",
-                "info": "#651FFF"
-            },
-            "Sunset Orange": {
-                "name": "Sunset Orange",
-                "description": "Warm, energetic theme with orange and red hues",
-                "primary_accent": "#FF7043",
-                "secondary_accent": "#FFB300",
-                "background": "#FFF3E0",
-                "surface": "#FFE0B2",
-                "text_primary": "#BF360C",
-                "text_secondary": "#FF8A65",
-                "border": "#FFB74D",
-                "success": "#43A047",
-                "warning": "#FFA000",
-                "danger": "#D32F2F",
-                "info": "#FF7043"
-            }
-        }
+        return _PREDEFINED_THEMES
+    
+    @property
+    def custom_themes(self) -> Dict[str, Dict[str, str]]:
+        """Custom themes, loaded from file on first access"""
+        if self._custom_themes is None:
+            self._custom_themes = self._load_custom_themes()
+        return self._custom_themes
+    
+    @property
+    def _themes(self) -> Dict[str, Dict[str, str]]:
+        """All themes by name; a custom theme never shadows a predefined one"""
+        if self._theme_map is None:
+            themes = dict(self.predefined_themes)
+            for name, theme in self.custom_themes.items():
+                if name not in self._predefined_names:
+                    themes[name] = theme
+            self._theme_map = themes
+        return self._theme_map
     
     def _load_custom_themes(self) -> Dict[str, Dict[str, str]]:
         """Load custom themes from file"""
+        self._themes_changed()
         try:
             if self.themes_file.exists():
-                with open(self.themes_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _json_loads(self.themes_file.read_bytes())
         except Exception as e:
             print(f"Error loading custom themes: {e}")
         return {}
@@ -201,25 +271,75 @@ class ColorPalette:
     def save_custom_themes(self) -> None:
         """Save custom themes to file"""
         try:
-            with open(self.themes_file, 'w', encoding='utf-8') as f:
-                json.dump(self.custom_themes, f, indent=2, ensure_ascii=False)
+            with self._save_lock:  # May run on the save timer thread
+                themes = dict(self.custom_themes)
+            # Write a sibling file and swap it in so a crash never leaves a torn themes file
+            temp_file = self.themes_file.with_name(self.themes_file.name + ".tmp")
+            temp_file.write_bytes(_json_dumps(themes))
+            os.replace(temp_file, self.themes_file)
         except Exception as e:
             print(f"Error saving custom themes: {e}")
     
+    def _mark_dirty(self) -> None:
+        """Schedule a save, coalescing theme edits made in quick succession"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write pending custom theme changes to file"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            # Write under the lock so a concurrent clear_custom_themes cannot be undone
+            self.save_custom_themes()
+    
+    def clear_custom_themes(self) -> bool:
+        """Delete every custom theme and the themes file, dropping any pending save"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
+            self._custom_themes = {}
+            self._theme_map = None
+            self._themes_changed()
+            try:
+                if self.themes_file.exists():
+                    self.themes_file.unlink()
+                return True
+            except Exception as e:
+                print(f"Error clearing custom themes: {e}")
+                return False
+    
     def get_theme(self, theme_name: str) -> Optional[Dict[str, str]]:
         """Get a theme by name (predefined or custom)"""
-        if theme_name in self.predefined_themes:
-            return self.predefined_themes[theme_name]
-        elif theme_name in self.custom_themes:
-            return self.custom_themes[theme_name]
-        return None
+        return self._themes.get(theme_name)
+    
+    def _store_custom_theme(self, name: str, theme: Dict[str, str]) -> None:
+        """Add or replace a custom theme and schedule saving it"""
+        with self._save_lock:
+            self.custom_themes[name] = theme
+            if name not in self._predefined_names:
+                self._themes[name] = theme
+            self._themes_changed()
+            self._mark_dirty()
+    
+    def _themes_changed(self) -> None:
+        """Invalidate cached theme lookups after the custom themes change"""
+        self._themes_version += 1
+        self._preview_cache.clear()
     
     def get_all_themes(self) -> Dict[str, Dict[str, str]]:
-        """Get all available themes"""
-        all_themes = {}
-        all_themes.update(self.predefined_themes)
-        all_themes.update(self.custom_themes)
-        return all_themes
+        """Get a snapshot of all available themes; later saves and imports do not change it"""
+        return dict(self._themes)
     
     def get_available_themes(self) -> List[str]:
         """Get list of available theme names (alias for get_theme_names)"""
@@ -227,7 +347,10 @@ class ColorPalette:
     
     def get_theme_names(self) -> List[str]:
         """Get list of all theme names"""
-        return list(self.get_all_themes().keys())
+        if self._cache_version != self._themes_version or self._theme_names_cache is None:
+            self._theme_names_cache = tuple(self._themes)
+            self._cache_version = self._themes_version
+        return list(self._theme_names_cache)
     
     def create_custom_theme(self, name: str, colors: Dict[str, str], description: str = "") -> bool:
         """Create a new custom theme"""
@@ -237,8 +360,7 @@ class ColorPalette:
                 "description": description,
                 **colors
             }
-            self.custom_themes[name] = theme
-            self.save_custom_themes()
+            self._store_custom_theme(name, theme)
             return True
         except Exception as e:
             print(f"Error creating custom theme: {e}")
@@ -252,11 +374,16 @@ class ColorPalette:
     
     def delete_custom_theme(self, name: str) -> bool:
         """Delete a custom theme"""
+        if name in self._predefined_names:
+            return False
         try:
-            if name in self.custom_themes:
-                del self.custom_themes[name]
-                self.save_custom_themes()
-                return True
+            with self._save_lock:
+                if name in self.custom_themes:
+                    del self.custom_themes[name]
+                    del self._themes[name]
+                    self._themes_changed()
+                    self._mark_dirty()
+                    return True
         except Exception as e:
             print(f"Error deleting custom theme: {e}")
         return False
@@ -266,8 +393,7 @@ class ColorPalette:
         try:
             theme = self.get_theme(theme_name)
             if theme:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(theme, f, indent=2, ensure_ascii=False)
+                Path(filepath).write_bytes(_json_dumps(theme))
                 return True
         except Exception as e:
             print(f"Error exporting theme: {e}")
@@ -276,12 +402,10 @@ class ColorPalette:
     def import_theme(self, filepath: str) -> bool:
         """Import a theme from a file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                theme = json.load(f)
+            theme = _json_loads(Path(filepath).read_bytes())
             
             if "name" in theme:
-                self.custom_themes[theme["name"]] = theme
-                self.save_custom_themes()
+                self._store_custom_theme(theme["name"], theme)
                 return True
         except Exception as e:
             print(f"Error importing theme: {e}")
@@ -290,9 +414,7 @@ class ColorPalette:
     def get_color_picker(self, parent, title: str = "Choose Color", initial_color: str = "#000000") -> Optional[str]:
         """Open a color picker dialog"""
         try:
-            color = colorchooser.askcolor(initial_color, title=title)
-            if color[1]:  # color[1] contains the hex color
-                return color[1]
+            return ask_color(initial_color, title, parent)
         except Exception as e:
             print(f"Error opening color picker: {e}")
         return None
@@ -304,38 +426,30 @@ class ColorPalette:
         
         # Check if it's a valid hex color
         if color.startswith('#'):
-            if len(color) == 7 and all(c in '0123456789ABCDEFabcdef' for c in color[1:]):
+            try:
+                parse_hex(color)
                 return True
+            except ValueError:
+                return False
         
         # Check if it's a valid rgba color
-        if color.startswith('rgba(') and color.endswith(')'):
-            try:
-                parts = color[5:-1].split(',')
-                if len(parts) == 4:
-                    r, g, b, a = parts
-                    if (0 <= float(r.strip()) <= 255 and 
-                        0 <= float(g.strip()) <= 255 and 
-                        0 <= float(b.strip()) <= 255 and 
-                        0 <= float(a.strip()) <= 1):
-                        return True
-            except:
-                pass
+        match = _RGBA_RE.fullmatch(color)
+        if match:
+            r, g, b, a = map(float, match.groups())
+            return r <= 255 and g <= 255 and b <= 255 and a <= 1
         
         return False
     
     def get_theme_preview_colors(self, theme_name: str) -> List[str]:
         """Get a list of colors for theme preview"""
-        theme = self.get_theme(theme_name)
-        if not theme:
-            return []
-        
-        return [
-            theme.get("primary_accent", "#000000"),
-            theme.get("secondary_accent", "#000000"),
-            theme.get("background", "#000000"),
-            theme.get("surface", "#000000"),
-            theme.get("text_primary", "#000000")
-        ]
+        colors = self._preview_cache.get(theme_name)
+        if colors is None:
+            theme = self.get_theme(theme_name)
+            if not theme:
+                return []
+            colors = tuple(theme.get(key, "#000000") for key in _PREVIEW_KEYS)
+            self._preview_cache[theme_name] = colors
+        return list(colors)
     
     def get_theme_colors(self, theme_name: str) -> Dict[str, str]:
         """Get all colors for a specific theme"""
@@ -344,6 +458,26 @@ class ColorPalette:
             return theme
         return {}
 
+# Colors recently chosen in any color dialog, newest first
+MAX_RECENT_COLORS = 8
+_recent_colors = []
+
+def ask_color(initial_color: str, title: str = "Choose Color", parent=None) -> Optional[str]:
+    """Open a color chooser and return the picked hex color, or None if cancelled"""
+    from tkinter import colorchooser
+    _, hex_color = colorchooser.askcolor(initial_color, title=title, parent=parent)
+    if not hex_color:
+        return None
+    if hex_color in _recent_colors:
+        _recent_colors.remove(hex_color)
+    _recent_colors.insert(0, hex_color)
+    del _recent_colors[MAX_RECENT_COLORS:]
+    return hex_color
+
+def get_recent_colors() -> List[str]:
+    """Get the colors recently picked through ask_color, newest first"""
+    return list(_recent_colors)
+
 # Global instance
 _color_palette = None
 
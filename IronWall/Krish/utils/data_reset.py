@@ -7,19 +7,163 @@ import os
 import shutil
 import json
 import glob
+import fnmatch
+import hashlib
+import re
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 import tkinter as tk
 from tkinter import messagebox, ttk
 import threading
+import concurrent.futures
+from itertools import repeat
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+COPY_BUFFER_SIZE = 1 << 20  # Copy files in 1 MiB chunks
+COPY_WORKERS = min(8, (os.cpu_count() or 1) * 2)  # Concurrent copies; the work is I/O bound
+BACKUP_MANIFEST = "manifest.json"  # Size, mtime and digest of each file in the latest reset backup
+
+FICLONE = 0x40049409  # Linux ioctl sharing a whole file's blocks (linux/fs.h)
+_NO_CLONE_DEVICES = set()  # (source, destination) device pairs that rejected FICLONE
+
+def _reflink(src_fd: int, dst_fd: int, src_dev: int) -> bool:
+    """Clone the source into the destination on copy-on-write filesystems, returning False if unsupported"""
+    if not HAS_FCNTL:
+        return False
+    devices = (src_dev, os.fstat(dst_fd).st_dev)
+    if devices in _NO_CLONE_DEVICES:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        _NO_CLONE_DEVICES.add(devices)  # Not a CoW filesystem, or the files live on different ones
+        return False
+
+def _kernel_copy(copy_chunk, src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy with an in-kernel primitive, returning False if it cannot handle these files"""
+    offset = 0
+    while offset < size:
+        try:
+            sent = copy_chunk(src_fd, dst_fd, offset, min(size - offset, COPY_BUFFER_SIZE))
+        except OSError:
+            if offset == 0:
+                return False  # Unsupported here (e.g. across filesystems); nothing written yet
+            raise
+        if sent == 0:
+            if offset == 0:
+                return False
+            break  # Source shrank while copying
+        offset += sent
+    return True
+
+# In-kernel copy primitives, fastest first: copy_file_range can clone blocks, sendfile avoids user space
+_KERNEL_COPIES = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIES.append(lambda src, dst, offset, count: os.copy_file_range(src, dst, count, offset, offset))
+if hasattr(os, "sendfile"):
+    _KERNEL_COPIES.append(lambda src, dst, offset, count: os.sendfile(dst, src, offset, count))
+
+def _json_dumps(obj) -> bytes:
+    """Encode an object as indented UTF-8 JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _file_digest(path) -> str:
+    """Hash a file's contents with SHA-256"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def _write_empty_json(path, literal: bytes = b"[]") -> None:
+    """Overwrite a JSON file with an empty array or object without running an encoder"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.write(fd, literal)
+    finally:
+        os.close(fd)
+
+def _unlink_files(directory, names: List[str]) -> None:
+    """Unlink several files in one directory, resolving the directory path only once"""
+    if os.unlink in os.supports_dir_fd:
+        dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            for name in names:
+                os.unlink(name, dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+    else:
+        for name in names:
+            os.unlink(os.path.join(directory, name))
+
+def _clear_directory(directory) -> None:
+    """Empty a directory in place instead of removing and recreating it"""
+    files, subdirs = [], []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            (subdirs if entry.is_dir(follow_symlinks=False) else files).append(entry.name)
+    _unlink_files(directory, files)
+    for name in subdirs:
+        shutil.rmtree(os.path.join(directory, name))
+
+def _fast_copy(src, dst):
+    """Copy a file with its metadata like shutil.copy2, using reflinks, kernel copies or large buffers"""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        src_stat = os.fstat(fsrc.fileno())
+        size = src_stat.st_size
+        copied = (_reflink(fsrc.fileno(), fdst.fileno(), src_stat.st_dev) or
+                  any(_kernel_copy(copy_chunk, fsrc.fileno(), fdst.fileno(), size)
+                      for copy_chunk in _KERNEL_COPIES))
+        if not copied:
+            buffer = bytearray(COPY_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                length = fsrc.readinto(buffer)
+                if not length:
+                    break
+                written = 0
+                while written < length:
+                    written += fdst.write(view[written:length])
+    shutil.copystat(src, dst)
+    return dst
 
 class DataResetManager:
     """Manages comprehensive data reset operations for IronWall Antivirus"""
     
+    # Per-file log entries are stored as (message key, name) and only formatted when the log is read
+    LOG_MESSAGES = {
+        "backed_up": "Backed up: {}",
+        "backed_up_directory": "Backed up directory: {}",
+        "backed_up_diagnostic": "Backed up diagnostic: {}",
+        "removed_quarantined": "Removed quarantined file: {}",
+        "removed_diagnostic": "Removed diagnostic file: {}",
+        "restored": "Restored: {}",
+        "restored_directory": "Restored directory: {}",
+    }
+    
     def __init__(self, base_dir: str = None):
         self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent
-        self.reset_log = []
+        self._reset_log = []
+        self._step_log = threading.local()  # Per-thread log while reset steps run concurrently
         
         # Define all data files and directories to reset
         self.data_files = [
@@ -27,8 +171,10 @@ class DataResetManager:
             "threat_database.json", 
             "scan_history.json",
             "system_logs.json",
+            "system_logs.json.jsonl",
             "scheduled_scans.json",
-            "network_rules.json"
+            "network_rules.json",
+            "themes.json"
         ]
         
         self.data_directories = [
@@ -37,9 +183,14 @@ class DataResetManager:
             "restore_points"
         ]
         
+        # Resolve the data paths once; every reset operation looks them up
+        self._data_file_paths = {name: self.base_dir / name for name in self.data_files}
+        self._data_dir_paths = {name: self.base_dir / name for name in self.data_directories}
+        
         self.diagnostic_files = [
             "ironwall_diagnostic_*.json"
         ]
+        self._diagnostic_re = re.compile("|".join(fnmatch.translate(pattern) for pattern in self.diagnostic_files))
         
         # Backup directory for reset operations
         self.backup_dir = self.base_dir / "reset_backups"
@@ -51,47 +202,149 @@ class DataResetManager:
             backup_path = self.backup_dir / f"pre_reset_backup_{timestamp}"
             backup_path.mkdir(parents=True, exist_ok=True)
             
+            # Collect every copy first, then run them concurrently
+            copies = []
+            messages = []
+            
             # Backup data files
-            for file_name in self.data_files:
-                file_path = self.base_dir / file_name
+            for file_name, file_path in self._data_file_paths.items():
                 if file_path.exists():
-                    shutil.copy2(file_path, backup_path / file_name)
-                    self.reset_log.append(f"Backed up: {file_name}")
+                    copies.append((file_path, backup_path / file_name))
+                    messages.append(("backed_up", file_name))
             
             # Backup data directories
-            for dir_name in self.data_directories:
-                dir_path = self.base_dir / dir_name
+            for dir_name, dir_path in self._data_dir_paths.items():
                 if dir_path.exists():
-                    backup_dir = backup_path / dir_name
-                    shutil.copytree(dir_path, backup_dir, dirs_exist_ok=True)
-                    self.reset_log.append(f"Backed up directory: {dir_name}")
+                    copies.extend(self._tree_copies(dir_path, backup_path / dir_name))
+                    messages.append(("backed_up_directory", dir_name))
             
             # Backup diagnostic files
-            for pattern in self.diagnostic_files:
-                for file_path in self.base_dir.glob(pattern):
-                    shutil.copy2(file_path, backup_path / file_path.name)
-                    self.reset_log.append(f"Backed up diagnostic: {file_path.name}")
-            
-            self.reset_log.append(f"Backup created at: {backup_path}")
+            for entry in self._diagnostic_entries():
+                copies.append((entry.path, backup_path / entry.name))
+                messages.append(("backed_up_diagnostic", entry.name))
+            
+            # Files unchanged since the last backup are hard linked from it instead of copied
+            previous_path, previous_files = self._load_backup_manifest()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                futures = {}
+                for src, dst in copies:
+                    relative = os.path.relpath(dst, backup_path)
+                    futures[relative] = executor.submit(self._backup_file, src, dst,
+                                                        previous_path / relative if previous_path else None,
+                                                        previous_files.get(relative))
+            files = {relative: future.result() for relative, future in futures.items()}
+            self._save_backup_manifest(backup_path, files)
+            
+            self._log_entries(messages)
+            self._log(f"Backup created at: {backup_path}")
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Backup failed: {e}")
+            self._log(f"Backup failed: {e}")
             return False
     
+    def _backup_file(self, src, dst, previous_copy: Optional[Path], previous_entry: Optional[dict]) -> dict:
+        """Back up one file, linking the previous backup's copy if the contents match
+
+        Returns the file's manifest entry. Only files whose size and modification time match
+        the previous entry are hashed; anything else has changed and is copied straight away.
+        """
+        stat = os.stat(src)
+        entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": None}
+        if (previous_copy is not None and isinstance(previous_entry, dict) and
+                previous_entry.get("size") == stat.st_size and
+                previous_entry.get("mtime_ns") == stat.st_mtime_ns):
+            entry["sha256"] = _file_digest(src)
+            if entry["sha256"] == previous_entry.get("sha256"):
+                try:
+                    os.link(previous_copy, dst)
+                    return entry
+                except OSError:
+                    pass  # Previous copy removed, or the filesystem has no hard links
+        _fast_copy(src, dst)
+        return entry
+    
+    def _load_backup_manifest(self) -> tuple:
+        """Return the latest backup's folder and file entries, or (None, {}) if it is gone"""
+        try:
+            with open(self.backup_dir / BACKUP_MANIFEST, 'rb') as f:
+                manifest = json.loads(f.read())
+            previous_path = self.backup_dir / manifest["backup"]
+            if previous_path.is_dir():
+                return previous_path, manifest["files"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None, {}
+    
+    def _save_backup_manifest(self, backup_path: Path, files: Dict[str, dict]) -> None:
+        """Record the file entries of a finished backup for the next one"""
+        manifest_file = self.backup_dir / BACKUP_MANIFEST
+        temp_file = manifest_file.with_name(manifest_file.name + ".tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(_json_dumps({"backup": backup_path.name, "files": files}))
+        os.replace(temp_file, manifest_file)
+    
+    def _diagnostic_entries(self) -> List[os.DirEntry]:
+        """List the diagnostic report files in the data directory"""
+        if not self.base_dir.exists():
+            return []
+        with os.scandir(self.base_dir) as entries:
+            return [entry for entry in entries
+                    if self._diagnostic_re.match(entry.name) and entry.is_file(follow_symlinks=False)]
+    
+    def _tree_copies(self, src_dir: Path, dst_dir: Path) -> List[tuple]:
+        """Create dst_dir's folder structure and list the file copies that fill it"""
+        copies = []
+        for root, dirs, files in os.walk(src_dir):
+            target = dst_dir / os.path.relpath(root, src_dir)
+            target.mkdir(parents=True, exist_ok=True)
+            copies.extend((os.path.join(root, name), target / name) for name in files)
+        return copies
+    
+    def _copy_files(self, copies: List[tuple]) -> None:
+        """Copy (source, destination) pairs concurrently, raising the first failure"""
+        if not copies:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            futures = [executor.submit(_fast_copy, src, dst) for src, dst in copies]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+    
     def reset_settings(self) -> bool:
         """Reset settings to factory defaults"""
         try:
             from .settings_manager import SettingsManager
             
-            settings_manager = SettingsManager(str(self.base_dir / "ironwall_settings.json"))
+            settings_manager = SettingsManager(str(self._data_file_paths["ironwall_settings.json"]))
             settings_manager.reset_to_defaults()
             
-            self.reset_log.append("Settings reset to factory defaults")
+            self._log("Settings reset to factory defaults")
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Settings reset failed: {e}")
+            self._log(f"Settings reset failed: {e}")
+            return False
+    
+    def reset_custom_themes(self) -> bool:
+        """Delete custom color themes"""
+        try:
+            from .color_palette import get_color_palette
+            
+            themes_file = self._data_file_paths["themes.json"]
+            palette = get_color_palette()
+            if os.path.abspath(palette.themes_file) == os.path.abspath(themes_file):
+                # The running palette may have a pending save that would write the themes back
+                if not palette.clear_custom_themes():
+                    raise OSError("could not remove the themes file")
+                self._log("Custom themes cleared")
+            elif themes_file.exists():
+                themes_file.unlink()
+                self._log("Custom themes cleared")
+            
+            return True
+            
+        except Exception as e:
+            self._log(f"Custom themes reset failed: {e}")
             return False
     
     def reset_threat_database(self) -> bool:
@@ -99,187 +352,236 @@ class DataResetManager:
         try:
             from .threat_database import ThreatDatabase
             
-            threat_db = ThreatDatabase(str(self.base_dir / "threat_database.json"))
+            threat_db = ThreatDatabase(str(self._data_file_paths["threat_database.json"]))
             threat_db.clear_database()
             
-            self.reset_log.append("Threat database cleared")
+            self._log("Threat database cleared")
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Threat database reset failed: {e}")
+            self._log(f"Threat database reset failed: {e}")
             return False
     
     def reset_quarantine(self) -> bool:
         """Reset quarantine database and clear quarantined files"""
         try:
-            quarantine_dir = self.base_dir / "quarantine"
+            quarantine_dir = self._data_dir_paths["quarantine"]
             if quarantine_dir.exists():
-                # Remove all files except the database file
-                for file_path in quarantine_dir.glob("*"):
-                    if file_path.is_file() and file_path.name != "quarantine_db.json":
-                        file_path.unlink()
-                        self.reset_log.append(f"Removed quarantined file: {file_path.name}")
+                # Remove all files except the database file, noting whether the database exists
+                names = []
+                has_db = False
+                with os.scandir(quarantine_dir) as entries:
+                    for entry in entries:
+                        if entry.name == "quarantine_db.json":
+                            has_db = True
+                        elif entry.is_file():
+                            names.append(entry.name)
+                _unlink_files(quarantine_dir, names)
+                self._log_entries(zip(repeat("removed_quarantined"), names))
                 
                 # Clear quarantine database
-                db_file = quarantine_dir / "quarantine_db.json"
-                if db_file.exists():
-                    with open(db_file, 'w') as f:
-                        json.dump({}, f)
-                    self.reset_log.append("Quarantine database cleared")
+                if has_db:
+                    _write_empty_json(quarantine_dir / "quarantine_db.json", b"{}")
+                    self._log("Quarantine database cleared")
             
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Quarantine reset failed: {e}")
+            self._log(f"Quarantine reset failed: {e}")
             return False
     
     def reset_scan_history(self) -> bool:
         """Reset scan history"""
         try:
-            history_file = self.base_dir / "scan_history.json"
+            history_file = self._data_file_paths["scan_history.json"]
             if history_file.exists():
-                with open(history_file, 'w') as f:
-                    json.dump([], f)
-                self.reset_log.append("Scan history cleared")
+                _write_empty_json(history_file)
+                self._log("Scan history cleared")
             
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Scan history reset failed: {e}")
+            self._log(f"Scan history reset failed: {e}")
             return False
     
     def reset_system_logs(self) -> bool:
         """Reset system logs"""
         try:
-            logs_file = self.base_dir / "system_logs.json"
+            from .logger import logger
+            
+            logs_file = self._data_file_paths["system_logs.json"]
+            if os.path.abspath(logger.log_file) == os.path.abspath(logs_file):
+                # The running logger holds the journal open and would write its
+                # in-memory events back, so it has to do the clearing itself
+                if not logger.clear_logs():
+                    raise OSError("could not rewrite the log files")
+                self._log("System logs cleared")
+                return True
+            
             if logs_file.exists():
-                with open(logs_file, 'w') as f:
-                    json.dump([], f)
-                self.reset_log.append("System logs cleared")
+                _write_empty_json(logs_file)
+                self._log("System logs cleared")
+            
+            # Events the logger has not compacted into the log file yet
+            journal_file = self._data_file_paths["system_logs.json.jsonl"]
+            if journal_file.exists():
+                journal_file.unlink()
             
             return True
             
         except Exception as e:
-            self.reset_log.append(f"System logs reset failed: {e}")
+            self._log(f"System logs reset failed: {e}")
             return False
     
     def reset_scheduled_scans(self) -> bool:
         """Reset scheduled scans"""
         try:
-            scans_file = self.base_dir / "scheduled_scans.json"
+            scans_file = self._data_file_paths["scheduled_scans.json"]
             if scans_file.exists():
-                with open(scans_file, 'w') as f:
-                    json.dump([], f)
-                self.reset_log.append("Scheduled scans cleared")
+                _write_empty_json(scans_file)
+                self._log("Scheduled scans cleared")
             
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Scheduled scans reset failed: {e}")
+            self._log(f"Scheduled scans reset failed: {e}")
             return False
     
     def reset_network_rules(self) -> bool:
         """Reset network rules to defaults"""
         try:
-            rules_file = self.base_dir / "network_rules.json"
+            rules_file = self._data_file_paths["network_rules.json"]
             default_rules = {
                 "rules": [],
                 "last_updated": datetime.now().isoformat(),
                 "version": "1.0"
             }
             
-            with open(rules_file, 'w') as f:
-                json.dump(default_rules, f, indent=2)
+            with open(rules_file, 'wb') as f:
+                f.write(_json_dumps(default_rules))
             
-            self.reset_log.append("Network rules reset to defaults")
+            self._log("Network rules reset to defaults")
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Network rules reset failed: {e}")
+            self._log(f"Network rules reset failed: {e}")
             return False
     
     def reset_backups(self) -> bool:
         """Clear backup directories"""
         try:
-            backup_dir = self.base_dir / "backups"
+            backup_dir = self._data_dir_paths["backups"]
             if backup_dir.exists():
-                shutil.rmtree(backup_dir)
-                backup_dir.mkdir(exist_ok=True)
-                self.reset_log.append("Backup directories cleared")
+                _clear_directory(backup_dir)
+                self._log("Backup directories cleared")
             
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Backup reset failed: {e}")
+            self._log(f"Backup reset failed: {e}")
             return False
     
     def reset_restore_points(self) -> bool:
         """Clear restore points"""
         try:
-            restore_dir = self.base_dir / "restore_points"
+            restore_dir = self._data_dir_paths["restore_points"]
             if restore_dir.exists():
-                shutil.rmtree(restore_dir)
-                restore_dir.mkdir(exist_ok=True)
-                self.reset_log.append("Restore points cleared")
+                _clear_directory(restore_dir)
+                self._log("Restore points cleared")
             
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Restore points reset failed: {e}")
+            self._log(f"Restore points reset failed: {e}")
             return False
     
     def clear_diagnostic_files(self) -> bool:
         """Clear diagnostic report files"""
         try:
-            cleared_count = 0
-            for pattern in self.diagnostic_files:
-                for file_path in self.base_dir.glob(pattern):
-                    file_path.unlink()
-                    cleared_count += 1
-                    self.reset_log.append(f"Removed diagnostic file: {file_path.name}")
+            names = [entry.name for entry in self._diagnostic_entries()]
+            _unlink_files(self.base_dir, names)
+            self._log_entries(zip(repeat("removed_diagnostic"), names))
+            cleared_count = len(names)
             
             if cleared_count > 0:
-                self.reset_log.append(f"Cleared {cleared_count} diagnostic files")
+                self._log(f"Cleared {cleared_count} diagnostic files")
             
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Diagnostic files clear failed: {e}")
+            self._log(f"Diagnostic files clear failed: {e}")
             return False
     
     def reset_all_data(self, create_backup: bool = True) -> Dict[str, bool]:
         """Reset all IronWall data to factory defaults"""
         results = {}
-        self.reset_log.clear()
+        self._reset_log.clear()
         
         try:
             # Create backup if requested
             if create_backup:
                 results['backup'] = self.create_backup()
             
-            # Reset all data components
-            results['settings'] = self.reset_settings()
-            results['threat_database'] = self.reset_threat_database()
-            results['quarantine'] = self.reset_quarantine()
-            results['scan_history'] = self.reset_scan_history()
-            results['system_logs'] = self.reset_system_logs()
-            results['scheduled_scans'] = self.reset_scheduled_scans()
-            results['network_rules'] = self.reset_network_rules()
-            results['backups'] = self.reset_backups()
-            results['restore_points'] = self.reset_restore_points()
-            results['diagnostic_files'] = self.clear_diagnostic_files()
+            # Reset all data components; each touches its own files, so they run concurrently
+            steps = {
+                'settings': self.reset_settings,
+                'custom_themes': self.reset_custom_themes,
+                'threat_database': self.reset_threat_database,
+                'quarantine': self.reset_quarantine,
+                'scan_history': self.reset_scan_history,
+                'system_logs': self.reset_system_logs,
+                'scheduled_scans': self.reset_scheduled_scans,
+                'network_rules': self.reset_network_rules,
+                'backups': self.reset_backups,
+                'restore_points': self.reset_restore_points,
+                'diagnostic_files': self.clear_diagnostic_files,
+            }
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(steps)) as executor:
+                futures = {name: executor.submit(self._run_step, step) for name, step in steps.items()}
+            
+            # Merge the step logs in a fixed order so the log reads the same on every run
+            for name, future in futures.items():
+                results[name], messages = future.result()
+                self._log_entries(messages)
             
-            self.reset_log.append("Data reset completed")
+            self._log("Data reset completed")
             
         except Exception as e:
-            self.reset_log.append(f"Data reset failed: {e}")
+            self._log(f"Data reset failed: {e}")
             results['overall'] = False
         
         return results
     
+    def _log(self, message: str):
+        """Add one message to the log the current reset step writes to"""
+        getattr(self._step_log, "messages", self._reset_log).append(message)
+    
+    def _log_entries(self, entries):
+        """Add several entries, either messages or (LOG_MESSAGES key, name) tuples"""
+        getattr(self._step_log, "messages", self._reset_log).extend(entries)
+    
+    @property
+    def reset_log(self) -> List[str]:
+        """The reset operation log as formatted strings (a copy; use the reset methods to add entries)"""
+        return self.get_reset_log()
+    
+    @reset_log.setter
+    def reset_log(self, messages: List[str]):
+        self._reset_log = list(messages)
+    
+    def _run_step(self, step) -> tuple:
+        """Run a reset step in a worker thread, returning its result and log messages"""
+        self._step_log.messages = []
+        try:
+            return step(), self._step_log.messages
+        finally:
+            del self._step_log.messages
+    
     def get_reset_log(self) -> List[str]:
         """Get the reset operation log"""
-        return self.reset_log.copy()
+        messages = self.LOG_MESSAGES
+        return [entry if isinstance(entry, str) else messages[entry[0]].format(entry[1])
+                for entry in self._reset_log]
     
     def restore_from_backup(self, backup_path: str) -> bool:
         """Restore data from a backup"""
@@ -288,29 +590,32 @@ class DataResetManager:
             if not backup_dir.exists():
                 raise FileNotFoundError(f"Backup directory not found: {backup_path}")
             
+            copies = []
+            messages = []
+            
             # Restore data files
-            for file_name in self.data_files:
+            for file_name, target_file in self._data_file_paths.items():
                 backup_file = backup_dir / file_name
                 if backup_file.exists():
-                    target_file = self.base_dir / file_name
-                    shutil.copy2(backup_file, target_file)
-                    self.reset_log.append(f"Restored: {file_name}")
+                    copies.append((backup_file, target_file))
+                    messages.append(("restored", file_name))
             
             # Restore data directories
-            for dir_name in self.data_directories:
+            for dir_name, target_dir in self._data_dir_paths.items():
                 backup_data_dir = backup_dir / dir_name
-                target_dir = self.base_dir / dir_name
                 if backup_data_dir.exists():
                     if target_dir.exists():
-                        shutil.rmtree(target_dir)
-                    shutil.copytree(backup_data_dir, target_dir)
-                    self.reset_log.append(f"Restored directory: {dir_name}")
+                        _clear_directory(target_dir)
+                    copies.extend(self._tree_copies(backup_data_dir, target_dir))
+                    messages.append(("restored_directory", dir_name))
             
-            self.reset_log.append(f"Data restored from: {backup_path}")
+            self._copy_files(copies)
+            self._log_entries(messages)
+            self._log(f"Data restored from: {backup_path}")
             return True
             
         except Exception as e:
-            self.reset_log.append(f"Restore failed: {e}")
+            self._log(f"Restore failed: {e}")
             return False
 
 
@@ -358,6 +663,7 @@ class DataResetDialog:
         
         warning_text = ("This will reset ALL IronWall data to factory defaults:\n\n"
                        "• All settings will be reset to defaults\n"
+                       "• Custom color themes will be deleted\n"
                        "• Scan history will be cleared\n"
                        "• Quarantine will be emptied\n"
                        "• Threat database will be cleared\n"
@@ -414,36 +720,42 @@ class DataResetDialog:
         self.reset_button.config(state='disabled')
         self.cancel_button.config(state='disabled')
         
+        # Read Tk state here; the worker thread must not touch Tk
+        create_backup = self.backup_var.get()
+        self.status_var.set("Creating backup..." if create_backup else "Resetting data...")
+        self.progress_var.set(10)
+        
         # Start reset in background thread
-        reset_thread = threading.Thread(target=self.perform_reset)
+        reset_thread = threading.Thread(target=self.perform_reset, args=(create_backup,))
         reset_thread.daemon = True
         reset_thread.start()
     
-    def perform_reset(self):
+    def perform_reset(self, create_backup: bool = True):
         """Perform the actual reset operation"""
         try:
-            self.status_var.set("Creating backup...")
-            self.progress_var.set(10)
-            self.dialog.update()
-            
-            # Perform reset
-            results = self.data_reset_manager.reset_all_data(
-                create_backup=self.backup_var.get()
-            )
-            
-            self.progress_var.set(100)
-            self.status_var.set("Reset completed!")
-            
-            # Show results
-            self.show_results(results)
-            
+            results = self.data_reset_manager.reset_all_data(create_backup=create_backup)
         except Exception as e:
-            self.status_var.set(f"Reset failed: {e}")
-            messagebox.showerror("Reset Error", f"Data reset failed:\n{e}")
-        finally:
-            # Re-enable buttons
-            self.reset_button.config(state='normal')
-            self.cancel_button.config(state='normal')
+            self.dialog.after(0, self._on_reset_failed, e)
+            return
+        self.dialog.after(0, self._on_reset_finished, results)
+    
+    def _on_reset_failed(self, error):
+        """Report a failed reset (runs on the Tk thread)"""
+        self.status_var.set(f"Reset failed: {error}")
+        self._enable_buttons()
+        messagebox.showerror("Reset Error", f"Data reset failed:\n{error}")
+    
+    def _on_reset_finished(self, results: Dict[str, bool]):
+        """Report reset results (runs on the Tk thread)"""
+        self.progress_var.set(100)
+        self.status_var.set("Reset completed!")
+        self._enable_buttons()
+        self.show_results(results)
+    
+    def _enable_buttons(self):
+        """Re-enable the dialog buttons"""
+        self.reset_button.config(state='normal')
+        self.cancel_button.config(state='normal')
     
     def show_results(self, results: Dict[str, bool]):
         """Show reset results"""
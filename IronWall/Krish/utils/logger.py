@@ -6,10 +6,37 @@ Handles system event logging and audit trails
 import os
 import json
 import time
+import atexit
+from functools import cached_property
+from itertools import islice
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import List, Dict, Optional, Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw file bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_line(obj: Any) -> bytes:
+    """Encode an object as one compact UTF-8 JSON line"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode('utf-8')
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as indented UTF-8 JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
+
 class EventType(Enum):
     """Event types for system logging"""
     SCAN_STARTED = "scan_started"
@@ -37,34 +64,145 @@ class EventStatus(Enum):
 class Logger:
     """Main logger class for IronWall events"""
     
+    COMPACT_EVERY = 500  # Journaled events to collect before folding them into the log file
+    
+    # Icon shown for each event type
+    _ICONS = {
+        EventType.SCAN_STARTED: "🔍",
+        EventType.SCAN_COMPLETED: "✅",
+        EventType.SCAN_FAILED: "❌",
+        EventType.THREAT_DETECTED: "🦠",
+        EventType.THREAT_QUARANTINED: "🔒",
+        EventType.THREAT_DELETED: "🗑️",
+        EventType.THREAT_RESTORED: "📦",
+        EventType.QUARANTINE_ACTION: "📦",
+        EventType.PROTECTION_ALERT: "🚨",
+        EventType.SYSTEM_EVENT: "⚙️",
+        EventType.UPDATE_STARTED: "⬆️",
+        EventType.UPDATE_COMPLETED: "✅",
+        EventType.UPDATE_FAILED: "❌",
+        EventType.SCAN: "🔍"
+    }
+    
     def __init__(self, log_file: str = "system_logs.json"):
         self.log_file = log_file
-        self.logs = []
-        self.load_logs()
+        # New events are appended here, one JSON object per line, until the next compaction
+        self.journal_file = log_file + ".jsonl"
+        self._journal = None
+        self._journal_lines = 0
+        self._dirty = False  # In-memory logs differ from the log file
+        atexit.register(self.close)
+    
+    @cached_property
+    def logs(self) -> List[Dict[str, Any]]:
+        """All logged events, read from disk on first access"""
+        return self._read_logs()
     
     def load_logs(self):
-        """Load existing logs from file"""
+        """Load existing logs from file, including events still in the journal"""
+        self.logs = self._read_logs()
+    
+    def _read_logs(self) -> List[Dict[str, Any]]:
+        """Read the log file followed by the events still in the journal"""
+        logs = []
         try:
             if os.path.exists(self.log_file):
-                with open(self.log_file, 'r', encoding='utf-8') as f:
-                    self.logs = json.load(f)
+                with open(self.log_file, 'rb') as f:
+                    logs = _json_loads(f.read())
         except Exception as e:
             print(f"Error loading logs: {e}")
-            self.logs = []
+            logs = []
+        
+        self._journal_lines = 0
+        try:
+            if os.path.exists(self.journal_file):
+                with open(self.journal_file, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            logs.append(_json_loads(line))
+                        except ValueError:
+                            continue  # Partial line from an interrupted write
+                        self._journal_lines += 1
+        except Exception as e:
+            print(f"Error loading log journal: {e}")
+        
+        # Older entries only carry the formatted timestamp; parse it once here
+        for log in logs:
+            if 'ts' not in log:
+                log['ts'] = self._parse_timestamp(log.get('timestamp', ''))
+                self._dirty = True
+        return logs
+    
+    @staticmethod
+    def _parse_timestamp(timestamp: str) -> Optional[float]:
+        """Convert a formatted log timestamp to epoch seconds"""
+        try:
+            return datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').timestamp()
+        except (TypeError, ValueError):
+            return None
     
     def save_logs(self):
-        """Save logs to file"""
+        """Save logs to file if they changed since the last save"""
+        if not self._dirty:
+            return
+        self.compact()
+    
+    def compact(self) -> bool:
+        """Write all logs to the log file and empty the journal, returning False on failure"""
         try:
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                json.dump(self.logs, f, indent=2, ensure_ascii=False)
+            # Write a sibling file and swap it in so readers never see a partial file
+            temp_file = self.log_file + ".tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(_json_dumps(self.logs))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.log_file)
+            self._dirty = False
+            
+            # The log file now holds every journaled event
+            self.close()
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+            self._journal_lines = 0
+            return True
         except Exception as e:
             print(f"Error saving logs: {e}")
+            return False
+    
+    def flush(self):
+        """Push buffered journal entries to disk"""
+        if self._journal is not None:
+            self._journal.flush()
+    
+    def close(self):
+        """Flush and close the journal"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+    
+    def _append_to_journal(self, log_entry: Dict[str, Any]):
+        """Append one event to the journal, compacting once it grows large"""
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'ab')
+            self._journal.write(_json_line(log_entry))
+            self._journal.flush()  # Hand each event to the OS so a crash cannot drop it
+            self._journal_lines += 1
+        except Exception as e:
+            print(f"Error writing log entry: {e}")
+            return
+        if self._journal_lines >= self.COMPACT_EVERY:
+            self.compact()
     
     def log_event(self, event_type: EventType, description: str, status: str = "Success", 
                   severity: str = "Low", details: str = "", **kwargs):
         """Log a new event"""
+        now = time.time()
         log_entry = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': datetime.fromtimestamp(now).strftime('%Y-%m-%d %H:%M:%S'),
+            'ts': now,  # Epoch seconds, so date filters compare numbers instead of parsing
             'event_type': event_type.value,
             'description': description,
             'status': status,
@@ -73,7 +211,8 @@ class Logger:
             **kwargs
         }
         self.logs.append(log_entry)
-        self.save_logs()
+        self._dirty = True
+        self._append_to_journal(log_entry)
     
     def get_logs(self, event_types: Optional[List[EventType]] = None, 
                  statuses: Optional[List[EventStatus]] = None,
@@ -82,66 +221,51 @@ class Logger:
                  search_query: str = "",
                  limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get filtered logs"""
-        filtered_logs = []
+        # Resolve the filters once so the per-log check is a few set and string tests
+        event_type_values = {event_type.value for event_type in event_types} if event_types else None
+        status_values = {status.value for status in statuses} if statuses else None
+        search_lower = search_query.lower() if search_query else None
+        start_ts = start_date.timestamp() if start_date else None
+        end_ts = end_date.timestamp() if end_date else None
         
-        for log in self.logs:
+        def matches(log: Dict[str, Any]) -> bool:
             # Filter by event type
-            if event_types:
-                log_event_type = EventType(log.get('event_type', ''))
-                if log_event_type not in event_types:
-                    continue
+            if event_type_values is not None and log.get('event_type', '') not in event_type_values:
+                return False
             
             # Filter by status
-            if statuses:
-                log_status = log.get('status', '').lower()
-                if not any(status.value == log_status for status in statuses):
-                    continue
+            if status_values is not None and log.get('status', '').lower() not in status_values:
+                return False
             
             # Filter by date range
-            if start_date or end_date:
-                try:
-                    log_timestamp = datetime.strptime(log.get('timestamp', ''), '%Y-%m-%d %H:%M:%S')
-                    if start_date and log_timestamp < start_date:
-                        continue
-                    if end_date and log_timestamp > end_date:
-                        continue
-                except:
-                    continue
+            if start_ts is not None or end_ts is not None:
+                log_ts = log.get('ts')
+                if log_ts is None:
+                    return False
+                if start_ts is not None and log_ts < start_ts:
+                    return False
+                if end_ts is not None and log_ts > end_ts:
+                    return False
             
             # Filter by search query
-            if search_query:
-                search_lower = search_query.lower()
+            if search_lower is not None:
                 if (search_lower not in log.get('description', '').lower() and
                     search_lower not in log.get('details', '').lower()):
-                    continue
+                    return False
             
-            filtered_logs.append(log)
+            return True
         
-        # Apply limit
+        # Apply limit, scanning newest first so the search stops after enough matches
         if limit:
-            filtered_logs = filtered_logs[-limit:]
+            filtered_logs = list(islice(filter(matches, reversed(self.logs)), limit))
+            filtered_logs.reverse()
+            return filtered_logs
         
-        return filtered_logs
+        return list(filter(matches, self.logs))
     
     def get_event_type_icon(self, event_type: EventType) -> str:
         """Get icon for event type"""
-        icons = {
-            EventType.SCAN_STARTED: "🔍",
-            EventType.SCAN_COMPLETED: "✅",
-            EventType.SCAN_FAILED: "❌",
-            EventType.THREAT_DETECTED: "🦠",
-            EventType.THREAT_QUARANTINED: "🔒",
-            EventType.THREAT_DELETED: "🗑️",
-            EventType.THREAT_RESTORED: "📦",
-            EventType.QUARANTINE_ACTION: "📦",
-            EventType.PROTECTION_ALERT: "🚨",
-            EventType.SYSTEM_EVENT: "⚙️",
-            EventType.UPDATE_STARTED: "⬆️",
-            EventType.UPDATE_COMPLETED: "✅",
-            EventType.UPDATE_FAILED: "❌",
-            EventType.SCAN: "🔍"
-        }
-        return icons.get(event_type, "📝")
+        return self._ICONS.get(event_type, "📝")
     
     def export_logs(self, format: str = "csv") -> str:
         """Export logs to file"""
@@ -150,39 +274,49 @@ class Logger:
         
         if format == "csv":
             import csv
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow(['Timestamp', 'Event Type', 'Description', 'Status', 'Severity', 'Details'])
-                for log in self.logs:
-                    writer.writerow([
-                        log.get('timestamp', ''),
-                        log.get('event_type', ''),
-                        log.get('description', ''),
-                        log.get('status', ''),
-                        log.get('severity', ''),
-                        log.get('details', '')
-                    ])
+                writer.writerows((
+                    log.get('timestamp', ''),
+                    log.get('event_type', ''),
+                    log.get('description', ''),
+                    log.get('status', ''),
+                    log.get('severity', ''),
+                    log.get('details', '')
+                ) for log in self.logs)
         elif format == "json":
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.logs, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                f.write(_json_dumps(self.logs))
         
         return filename
     
-    def clear_logs(self):
-        """Clear all logs"""
+    def clear_logs(self) -> bool:
+        """Clear all logs in memory and on disk, returning False if the files could not be rewritten"""
+        self.close()
         self.logs = []
-        self.save_logs()
+        self._dirty = True
+        return self.compact()
     
     def set_retention_policy(self, days: int):
         """Set log retention policy (keep logs for specified days)"""
         if days <= 0:
             return
         
-        cutoff_date = datetime.now() - timedelta(days=days)
-        self.logs = [
-            log for log in self.logs
-            if datetime.strptime(log.get('timestamp', ''), '%Y-%m-%d %H:%M:%S') > cutoff_date
-        ]
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        
+        # Logs are appended in time order, so binary search for the first one to keep
+        logs = self.logs
+        low, high = 0, len(logs)
+        while low < high:
+            mid = (low + high) // 2
+            if (logs[mid].get('ts') or 0) > cutoff_ts:
+                high = mid
+            else:
+                low = mid + 1
+        if low:
+            del logs[:low]
+            self._dirty = True
         self.save_logs()
 
 # Global logger instance
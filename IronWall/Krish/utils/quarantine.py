@@ -112,10 +112,16 @@ class QuarantineManager:
             md5_hash = hashlib.md5()
             sha256_hash = hashlib.sha256()
             
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    md5_hash.update(chunk)
-                    sha256_hash.update(chunk)
+            # Read the file once and feed the same bytes to both hashes through a reused 1 MiB buffer
+            buffer = bytearray(1 << 20)
+            view = memoryview(buffer)
+            with open(file_path, 'rb', buffering=0) as f:
+                while True:
+                    length = f.readinto(buffer)
+                    if not length:
+                        break
+                    md5_hash.update(view[:length])
+                    sha256_hash.update(view[:length])
             
             return md5_hash.hexdigest(), sha256_hash.hexdigest()
         except Exception as e:
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 import threading
+from contextlib import contextmanager
 
 class SettingsManager:
     """Manages all IronWall Antivirus settings with persistence"""
@@ -16,6 +17,8 @@ class SettingsManager:
     def __init__(self, config_file: str = "ironwall_settings.json"):
         self.config_file = Path(config_file)
         self._lock = threading.Lock()
+        self._batch_depth = 0
+        self._batch_pending = False
         self._settings = self._load_default_settings()
         self.load_settings()
     
@@ -151,13 +154,31 @@ class SettingsManager:
     
     def save_settings(self) -> None:
         """Save settings to file"""
+        if self._batch_depth:
+            self._batch_pending = True  # Written once when the batch ends
+            return
         try:
             with self._lock:
-                with open(self.config_file, 'w', encoding='utf-8') as f:
+                # Write a sibling file and swap it in so readers never see a partial file
+                temp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+                with open(temp_file, 'w', encoding='utf-8') as f:
                     json.dump(self._settings, f, indent=2, ensure_ascii=False)
+                os.replace(temp_file, self.config_file)
         except Exception as e:
             print(f"Error saving settings: {e}")
     
+    @contextmanager
+    def batch(self):
+        """Group several setting changes into a single save"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_pending:
+                self._batch_pending = False
+                self.save_settings()
+    
     def get_setting(self, category: str, key: str, default: Any = None) -> Any:
         """Get a specific setting value"""
         try:
@@ -165,16 +186,60 @@ class SettingsManager:
         except KeyError:
             return default
     
-    def set_setting(self, category: str, key: str, value: Any) -> None:
-        """Set a specific setting value"""
+    def get_many(self, category: str, keys_with_defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Get several settings from one category in a single lookup"""
+        values = self._settings.get(category, {})
+        return {key: values.get(key, default) for key, default in keys_with_defaults.items()}
+    
+    def set_setting(self, category: str, key: str, value: Any) -> bool:
+        """Set a specific setting value, returning False if an immutable value was already set"""
         if category not in self._settings:
             self._settings[category] = {}
+        elif (isinstance(value, (str, int, float, bool, type(None))) and
+              key in self._settings[category] and self._settings[category][key] == value):
+            # Only immutable values can be compared: a dict or list may be the stored
+            # object itself, changed in place by the caller, and always compares equal
+            return False  # Unchanged, nothing to write
         self._settings[category][key] = value
         self.save_settings()
+        return True
+    
+    def _exclusion_list(self, category: str, excl_type: str) -> list:
+        """Get the stored exclusion list for a category and type, creating it if missing"""
+        exclusions = self._settings.setdefault(category, {}).setdefault("exclusions", {})
+        items = exclusions.get(excl_type)
+        if not isinstance(items, list):
+            items = exclusions[excl_type] = list(items or ())
+        return items
+    
+    # Exclusion edits only change memory; callers persist them with save_settings()
+    def append_exclusion(self, category: str, excl_type: str, item: str) -> bool:
+        """Add one exclusion, returning False if it was already excluded"""
+        items = self._exclusion_list(category, excl_type)
+        if item in items:
+            return False
+        items.append(item)
+        return True
+    
+    def remove_exclusion(self, category: str, excl_type: str, item: str) -> bool:
+        """Remove one exclusion, returning False if it was not excluded"""
+        items = self._exclusion_list(category, excl_type)
+        if item not in items:
+            return False
+        items.remove(item)
+        return True
+    
+    def clear_exclusions(self, category: str, excl_type: str) -> bool:
+        """Remove all exclusions of one type, returning False if there were none"""
+        items = self._exclusion_list(category, excl_type)
+        if not items:
+            return False
+        items.clear()
+        return True
     
     def get_category(self, category: str) -> Dict[str, Any]:
-        """Get all settings for a category"""
-        return self._settings.get(category, {})
+        """Get a snapshot of all settings for a category"""
+        return self._settings.get(category, {}).copy()
     
     def set_category(self, category: str, settings: Dict[str, Any]) -> None:
         """Set all settings for a category"""
@@ -199,9 +264,6 @@ class SettingsManager:
     
     def apply_theme_settings(self, theme_name: str) -> None:
         """Apply theme settings to the application"""
-        self.set_setting("appearance", "color_theme", theme_name)
-        self.set_setting("appearance", "use_custom_colors", False)
-        
         # Map theme names to ttkbootstrap themes
         theme_mapping = {
             "Light": "flatly",
@@ -213,12 +275,16 @@ class SettingsManager:
         }
         
         ttkbootstrap_theme = theme_mapping.get(theme_name, "flatly")
-        self.set_setting("appearance", "ttkbootstrap_theme", ttkbootstrap_theme)
+        with self.batch():
+            self.set_setting("appearance", "color_theme", theme_name)
+            self.set_setting("appearance", "use_custom_colors", False)
+            self.set_setting("appearance", "ttkbootstrap_theme", ttkbootstrap_theme)
     
     def apply_custom_colors(self, custom_colors: Dict[str, str]) -> None:
         """Apply custom color settings"""
-        self.set_setting("appearance", "custom_colors", custom_colors)
-        self.set_setting("appearance", "use_custom_colors", True)
+        with self.batch():
+            self.set_setting("appearance", "custom_colors", custom_colors)
+            self.set_setting("appearance", "use_custom_colors", True)
     
     def export_settings(self, filepath: str) -> bool:
         """Export settings to a file"""